@@ -14,17 +14,20 @@ import serial
 import time
 import re
 import json
-import glob
 import subprocess
+import shutil
 import platform
 import os
-import threading
+import errno
+import select
 import socket
 import struct
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional, Dict, List, Tuple
 from dataclasses import dataclass
 from datetime import datetime
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
 from rich.layout import Layout
@@ -37,6 +40,28 @@ try:
     HAS_REQUESTS = True
 except ImportError:
     HAS_REQUESTS = False
+
+# POSIX-only; flushes both serial queues in a single call
+try:
+    import termios
+    HAS_TERMIOS = True
+except ImportError:
+    HAS_TERMIOS = False
+
+# Optional import for talking to systemd over D-Bus without spawning systemctl
+try:
+    from jeepney import DBusAddress, MessageType, new_method_call
+    from jeepney.io.blocking import open_dbus_connection
+    HAS_JEEPNEY = True
+except ImportError:
+    HAS_JEEPNEY = False
+
+# Optional import for reading links, addresses and routes over netlink without spawning ip
+try:
+    from pyroute2 import IPRoute
+    HAS_PYROUTE2 = True
+except ImportError:
+    HAS_PYROUTE2 = False
 from rich.tree import Tree
 from rich.text import Text
 from rich import box
@@ -77,6 +102,49 @@ def auto_continue(seconds: int = 3, message: str = "Continuing") -> bool:
     console.print("\r" + " " * 60 + "\r", end="")  # Clear the line
     return False
 
+# Serial device name prefixes considered during Linux port detection
+_SERIAL_TTY_PREFIXES = ('ttyUSB', 'ttyACM', 'ttyAMA', 'ttyS')
+
+# Bus subsystems of real serial hardware under /sys/class/tty/<name>/device
+_SERIAL_SUBSYSTEMS = frozenset(('usb-serial', 'usb', 'platform', 'pci', 'pnp', 'amba', 'serial-base'))
+
+
+def list_serial_ports() -> List[str]:
+    """List candidate serial device paths from /sys/class/tty, skipping virtual and unpopulated ports"""
+    if not os.path.isdir('/sys/class/tty'):
+        # No sysfs (e.g. macOS), fall back to a single listing of /dev
+        try:
+            with os.scandir('/dev') as entries:
+                return sorted('/dev/' + entry.name for entry in entries
+                              if entry.name.startswith(_SERIAL_TTY_PREFIXES))
+        except OSError:
+            return []
+
+    paths = []
+    for entry in os.scandir('/sys/class/tty'):
+        name = entry.name
+        if not name.startswith(_SERIAL_TTY_PREFIXES):
+            continue
+
+        # Virtual terminals have no backing device
+        subsystem = os.path.realpath(os.path.join(entry.path, 'device', 'subsystem'))
+        if os.path.basename(subsystem) not in _SERIAL_SUBSYSTEMS:
+            continue
+
+        # Legacy 8250 ports with no UART behind them report type 0
+        if name.startswith('ttyS'):
+            try:
+                with open(os.path.join(entry.path, 'type')) as f:
+                    if f.read().strip() == '0':
+                        continue
+            except OSError:
+                pass
+
+        if os.path.exists('/dev/' + name):
+            paths.append('/dev/' + name)
+
+    return sorted(paths)
+
 # Port blacklist - can be set via environment variable
 # Example: export MODEMO_SKIP_PORTS="/dev/ttyUSB1,/dev/ttyUSB0"
 SKIP_PORTS = set(os.environ.get('MODEMO_SKIP_PORTS', '').split(',')) if os.environ.get('MODEMO_SKIP_PORTS') else set()
@@ -84,22 +152,272 @@ SKIP_PORTS = set(os.environ.get('MODEMO_SKIP_PORTS', '').split(',')) if os.envir
 # Debug mode - set MODEMO_DEBUG=1 for verbose output
 DEBUG_MODE = os.environ.get('MODEMO_DEBUG', '').lower() in ('1', 'true', 'yes')
 
-
-class ModemManagerHelper:
+# Serial read/write timeout (seconds) for interactive sessions
+_DEFAULT_SERIAL_TIMEOUT = 5
+
+# How long (seconds) a detected WiFi interface / default route / interface state is reused
+_WIFI_IFACE_TTL = 5.0
+_DEFAULT_ROUTE_TTL = 2.0
+_IFACE_STATUS_TTL = 2.0
+
+# Baud rates to probe during auto-detection, most common first. Cellular modems
+# boot at 115200; 9600 and 460800 cover the autobaud and high-speed UART cases
+_BAUD_PROBE_ORDER = (115200, 9600, 460800)
+
+# USB vendor IDs of cellular modem makers, probed before any other port
+KNOWN_MODEM_VIDS = frozenset((
+    0x2c7c,  # Quectel
+    0x1199,  # Sierra Wireless
+    0x1546,  # u-blox
+    0x1bc7,  # Telit
+    0x2cb7,  # Fibocom
+    0x12d1,  # Huawei
+    0x19d2,  # ZTE
+    0x1e0e,  # SIMCom
+    0x05c6,  # Qualcomm
+))
+
+# Last port that auto-detection found working, checked before a full scan
+_LAST_PORT_FILE = os.path.join(os.path.expanduser("~"), ".modemo", "last_port.json")
+
+# Port descriptions that are never cellular modems
+_RE_NON_MODEM_PORT = re.compile(r'bluetooth|rfcomm', re.IGNORECASE)
+
+# Final result codes that terminate an AT command response
+_RE_AT_FINAL = re.compile(rb'(?:^|[\r\n])(OK|ERROR|\+CME ERROR[^\r\n]*|\+CMS ERROR[^\r\n]*)\r\n')
+
+# Precompiled AT response patterns
+_RE_COPS = re.compile(r'\+COPS:\s*(\d+)(?:,(\d+),"([^"]*)"(?:,(\d+))?)?')
+_RE_REG = re.compile(r'\+(CREG|CGREG|CEREG):\s*(\d+)(?:,(\d+))?(?:,"([0-9A-F]+)","([0-9A-F]+)")?(?:,(\d+))?')
+_RE_CSQ = re.compile(r'\+CSQ:\s*(\d+),(\d+)')
+_RE_CGDCONT = re.compile(r'\+CGDCONT:\s*(\d+),"([^"]*)","([^"]*)"(?:,"([^"]*)")?')
+_RE_QNWINFO = re.compile(r'\+QNWINFO:\s*"([^"]*)",?"([^"]*)",?"([^"]*)",?(\d+)')
+_RE_QSPN = re.compile(r'\+QSPN:\s*"([^"]*)",?"([^"]*)",?"([^"]*)"')
+_RE_CPIN = re.compile(r'\+CPIN:\s*([^\r\n]*)')
+_RE_AT_PREFIX = re.compile(r'AT([+!]\w+)')
+_RE_ICCID_NONDIGIT = re.compile(r'[^0-9]')
+_RE_TTY = re.compile(r'/dev/tty\w+')
+_RE_COPS_SCAN = re.compile(r'\((\d+),"([^"]*)","([^"]*)","(\d+)",(\d+)\)')
+_RE_CGACT = re.compile(r'\+CGACT:\s*(\d+),(\d+)')
+_RE_TTYUSB = re.compile(r'ttyUSB(\d+)')
+_RE_CGPADDR_IPV4 = re.compile(r'\+CGPADDR:[^\r\n]*?"([0-9.]+)"')
+
+# `ip` command output
+_RE_IP_INET_CIDR = re.compile(r'inet\s+(\d+\.\d+\.\d+\.\d+(/\d+)?)')
+_RE_WLAN_IFACE = re.compile(r'wlan\d+')
+
+# Cellular network interface names, and the kernel's IFF_LOWER_UP link flag
+_RE_CELL_IFACE_NAME = re.compile(r'wwan\d+|ppp\d+|usb\d+|wwp\d+s\d+')
+_RE_IP_LINK_CELL = re.compile(r'\d+:\s+(' + _RE_CELL_IFACE_NAME.pattern + r'):')
+_IFF_LOWER_UP = 0x10000
+
+# AT response lookup tables, indexed by the numeric value the modem reports
+_COPS_MODE_TEXT = (
+    'Automatic',
+    'Manual',
+    'Deregister',
+    'Set format only',
+    'Manual/Automatic'
+)
+
+# Access technology (<AcT>), indexed by value
+_ACT_TEXT = (
+    'GSM',
+    'GSM Compact',
+    'UTRAN',
+    'GSM w/EGPRS',
+    'UTRAN w/HSDPA',
+    'UTRAN w/HSUPA',
+    'UTRAN w/HSDPA and HSUPA',
+    'E-UTRAN',
+    'EC-GSM-IoT',
+    'E-UTRAN (NB-S1 mode)',
+    'E-UTRA connected to 5GCN',
+    'NR connected to 5GCN'
+)
+
+_REG_STATUS_TEXT = (
+    'Not registered, not searching',
+    'Registered, home network',
+    'Not registered, searching',
+    'Registration denied',
+    'Unknown',
+    'Registered, roaming'
+)
+
+_SIM_STATUS_TEXT = {
+    'READY': 'SIM is ready',
+    'SIM PIN': 'SIM requires PIN',
+    'SIM PUK': 'SIM requires PUK',
+    'SIM PIN2': 'SIM requires PIN2',
+    'SIM PUK2': 'SIM requires PUK2'
+}
+
+# Bit error rate (<ber>) ranges, indexed by value
+_BER_TEXT = ('<0.2%', '0.2-0.4%', '0.4-0.8%', '0.8-1.6%', '1.6-3.2%', '3.2-6.4%', '6.4-12.8%', '>12.8%')
+
+# Received signal strength (<rssi>) as (dBm text, quality), indexed by value
+_RSSI_TABLE = (
+    (('<= -113 dBm', 'Very Poor'), ('-111 dBm', 'Very Poor'))
+    + tuple((f'{-109 + (rssi - 2) * 2} dBm',
+             'Poor' if rssi < 10 else 'Fair' if rssi < 15 else 'Good' if rssi < 20 else 'Excellent')
+            for rssi in range(2, 31))
+    + (('>= -51 dBm', 'Excellent'),)
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _csq_interpret(rssi: int, ber: int) -> Tuple[str, str, str]:
+    """Return (rssi_dbm, signal_quality, ber_text) for a raw +CSQ reading"""
+    rssi_dbm, quality = _RSSI_TABLE[rssi] if rssi < len(_RSSI_TABLE) else ('Unknown', 'Unknown')
+    ber_text = 'Unknown or not detectable' if ber == 99 else f'{ber} ({_BER_TEXT[min(ber, 7)]})'
+    return rssi_dbm, quality, ber_text
+
+# ModemManager helper subprocess settings: never inherit the terminal's stdin
+# and run in a separate session so a wedged systemctl cannot hold the TTY
+_RUN_KW = dict(capture_output=True, text=True, stdin=subprocess.DEVNULL, start_new_session=True)
+_MM_QUERY_TIMEOUT = 2
+_MM_CONTROL_TIMEOUT = 5
+
+# Helper tools resolved once at import; None when not installed, so callers
+# skip the fork/exec instead of paying for a FileNotFoundError every time
+_SYSTEMCTL_BIN = shutil.which('systemctl')
+_LSOF_BIN = shutil.which('lsof')
+_MMCLI_BIN = shutil.which('mmcli')
+
+# Network tools for the data transfer tests; fall back to the usual locations
+# since /sbin is often missing from a regular user's PATH
+_IP_BIN = shutil.which('ip') or '/sbin/ip'
+_SUDO_BIN = shutil.which('sudo') or '/usr/bin/sudo'
+_NETSH_BIN = shutil.which('netsh') or 'netsh'
+_ROUTE_BIN = shutil.which('route') or 'route'
+
+# LTE +QENG "servingcell" record: state, mode, <duplex skipped>, then mcc..rsrq,
+# with rssi and sinr optional. Each field may or may not be quoted
+_QENG_FIELD = r'"?([^",\r\n]*)"?'
+_RE_QENG_SERVINGCELL = re.compile(
+    r'\+QENG:\s*"servingcell",' + _QENG_FIELD + ',' + _QENG_FIELD + r',[^,]*,'
+    + ','.join([_QENG_FIELD] * 11) + r'(?:,' + _QENG_FIELD + r')?(?:,' + _QENG_FIELD + r')?'
+)
+
+# (parsed key, display format) for each _RE_QENG_SERVINGCELL group, in order
+_QENG_SERVINGCELL_FIELDS = (
+    ('state', '{}'),
+    ('mode', '{}'),
+    ('mcc', '{}'),
+    ('mnc', '{}'),
+    ('cellid', '{}'),
+    ('pcid', '{}'),
+    ('earfcn', '{}'),
+    ('freq_band', '{}'),
+    ('ul_bandwidth', '{}'),
+    ('dl_bandwidth', '{}'),
+    ('tac', '{}'),
+    ('rsrp', '{} dBm'),
+    ('rsrq', '{} dB'),
+    ('rssi', '{} dBm'),
+    ('sinr', '{} dB'),
+)
+
+# Registration status (<stat>) display colors, and the markup template for each
+_STATUS_COLOR = {0: 'red', 1: 'green', 2: 'yellow', 3: 'red', 4: 'red', 5: 'green'}
+_REG_MARKUP = {status: f"[{color}]{{}}[/{color}]" for status, color in _STATUS_COLOR.items()}
+
+
+def _fmt_status(status: int, text: str) -> Tuple[str, str]:
+    """Format a registration status code and its text as (code, colored markup) table cells"""
+    return str(status), _REG_MARKUP.get(status, "[red]{}[/red]").format(text)
+
+
+def _build_details(parsed: Dict, keys: Tuple[Tuple[str, str], ...]) -> str:
+    """Join the (key, label) pairs present in parsed data as 'LABEL: value, ...'"""
+    return ", ".join(f"{label}: {parsed[key]}" for key, label in keys if key in parsed)
+
+# Registration table rows: (status key, row label, detail (key, label) pairs)
+_REG_ROWS = (
+    ('creg_status', "CS (Voice)", (('lac', 'LAC'), ('ci', 'CI'))),
+    ('cgreg_status', "PS (Data)", (('lac', 'LAC'), ('ci', 'CI'), ('act_text', 'AcT'))),
+    ('cereg_status', "EPS (LTE)", (('lac', 'TAC'), ('ci', 'CI'), ('act_text', 'AcT'))),
+)
+
+# Registered (home or roaming) status codes
+_REG_STATUS_SET = frozenset({1, 5})
+
+# Signal quality assessment display colors
+_QUALITY_COLOR = {
+    'Excellent': 'green',
+    'Good': 'green',
+    'Fair': 'yellow',
+    'Poor': 'red',
+    'Very Poor': 'red'
+}
+_QUALITY_MARKUP = {quality: f"[{color}]{quality}[/{color}]" for quality, color in _QUALITY_COLOR.items()}
+
+# +COPS=? network scan <stat> and <AcT> display text
+_NET_STATUS_MAP = {
+    '0': 'Unknown',
+    '1': '[green]Available[/green]',
+    '2': '[blue]Current[/blue]',
+    '3': '[red]Forbidden[/red]'
+}
+
+_TECH_MAP = {
+    '0': 'GSM',
+    '1': 'GSM Compact',
+    '2': 'UTRAN',
+    '3': 'GSM w/EGPRS',
+    '4': 'UTRAN w/HSDPA',
+    '5': 'UTRAN w/HSUPA',
+    '6': 'UTRAN w/HSUPA+HSDPA',
+    '7': 'E-UTRAN (LTE)',
+    '8': 'EC-GSM-IoT',
+    '9': 'E-UTRAN NB-S1'
+}
+
+# Parsed keys each diagnostic display section needs; sections with none are skipped
+_DEVICE_KEYS = frozenset({'manufacturer', 'model', 'firmware', 'imei'})
+_SIM_KEYS = frozenset({'sim_status', 'iccid', 'imsi'})
+_NET_KEYS = frozenset({'creg_status', 'cgreg_status', 'cereg_status', 'operator'})
+_SIGNAL_KEYS = frozenset({'rssi_raw'})
+
+# Commands whose first response line is the value itself
+_FIRST_LINE_FIELDS = {
+    '+CIMI': 'imsi',
+    '+CGMI': 'manufacturer',
+    '+CGMM': 'model',
+    '+CGMR': 'firmware',
+    '+CGSN': 'imei',
+}
+
+_ICCID_COMMANDS = frozenset(('+CCID', '+ICCID', '+QCCID'))
+
+# Commands whose reply text may carry no +PREFIX: tag and may span several lines.
+# A chained reply can only attribute such lines when one of them is in the chain
+_UNTAGGED_REPLY_PREFIXES = frozenset(_FIRST_LINE_FIELDS) | _ICCID_COMMANDS
+
+# Diagnostic commands that report the same field; later duplicates are skipped
+_DIAG_FIELD_BY_COMMAND = {
+    "AT+CCID": "iccid",
+    "AT+QCCID": "iccid",
+}
+
+
+class _LinuxModemManagerHelper:
     """Helper to detect and manage ModemManager interference on Linux"""
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def is_running() -> bool:
         """Check if ModemManager is running"""
-        if not IS_LINUX:
+        # Not a systemd host, so systemctl cannot report on the service
+        if not _SYSTEMCTL_BIN or not os.path.isdir('/run/systemd/system'):
             return False
 
         try:
             result = subprocess.run(
-                ['systemctl', 'is-active', 'ModemManager'],
-                capture_output=True,
-                text=True,
-                timeout=2
+                [_SYSTEMCTL_BIN, 'is-active', 'ModemManager'],
+                timeout=_MM_QUERY_TIMEOUT,
+                **_RUN_KW
             )
             return result.returncode == 0 and 'active' in result.stdout
         except Exception:
@@ -108,40 +426,53 @@ class ModemManagerHelper:
     @staticmethod
     def is_blocking_port(port: str) -> bool:
         """Check if ModemManager is using a specific port"""
-        if not IS_LINUX:
-            return False
+        return port in _LinuxModemManagerHelper.get_blocked_ports([port])
+
+    @staticmethod
+    def get_blocked_ports(ports: List[str]) -> List[str]:
+        """Return the subset of ports ModemManager has open, using a single lsof call"""
+        blocked = []
+        if not ports or not _LSOF_BIN:
+            return blocked
 
         try:
-            # Check using lsof
+            # +c 0 disables lsof's 9-character command name truncation
             result = subprocess.run(
-                ['lsof', port],
-                capture_output=True,
-                text=True,
-                timeout=2
+                [_LSOF_BIN, '+c', '0', '-F', 'cn', '--'] + list(ports),
+                timeout=_MM_QUERY_TIMEOUT,
+                **_RUN_KW
             )
-            return 'ModemManager' in result.stdout
+            command = ''
+            for line in result.stdout.splitlines():
+                if line.startswith('c'):
+                    command = line[1:]
+                elif line.startswith('n') and command == 'ModemManager':
+                    if line[1:] in ports and line[1:] not in blocked:
+                        blocked.append(line[1:])
         except Exception:
-            return False
+            pass
+
+        return blocked
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_managed_ports() -> List[str]:
         """Get list of ports managed by ModemManager"""
         ports = []
-        if not IS_LINUX:
+        if not _MMCLI_BIN:
             return ports
 
         try:
             # Use mmcli to list modems
             result = subprocess.run(
-                ['mmcli', '-L'],
-                capture_output=True,
-                text=True,
-                timeout=2
+                [_MMCLI_BIN, '-L'],
+                timeout=_MM_QUERY_TIMEOUT,
+                **_RUN_KW
             )
             # Parse output for device paths
             for line in result.stdout.split('\n'):
                 if 'device' in line.lower():
-                    match = re.search(r'/dev/tty\w+', line)
+                    match = _RE_TTY.search(line)
                     if match:
                         ports.append(match.group(0))
         except Exception:
@@ -149,18 +480,66 @@ class ModemManagerHelper:
 
         return ports
 
+    @staticmethod
+    def _systemd_unit_call(method: str, target_states: Tuple[str, ...]) -> bool:
+        """Call a systemd Manager unit method (StopUnit/StartUnit) on ModemManager over D-Bus
+
+        The method returns as soon as the job is queued, so this then waits for the
+        unit's ActiveState to reach one of target_states, as systemctl does.
+        Returns False when D-Bus is unavailable, the call is refused or the state is
+        not reached in time, so the caller can fall back to systemctl (which can also
+        prompt for PolicyKit authorisation).
+        """
+        if not HAS_JEEPNEY:
+            return False
+
+        try:
+            systemd = DBusAddress('/org/freedesktop/systemd1',
+                                  bus_name='org.freedesktop.systemd1',
+                                  interface='org.freedesktop.systemd1.Manager')
+            message = new_method_call(systemd, method, 'ss', ('ModemManager.service', 'replace'))
+            with open_dbus_connection(bus='SYSTEM') as connection:
+                reply = connection.send_and_get_reply(message, timeout=_MM_CONTROL_TIMEOUT)
+                if reply.header.message_type != MessageType.method_return:
+                    return False
+
+                # LoadUnit, unlike GetUnit, still resolves once a stopped unit is unloaded
+                reply = connection.send_and_get_reply(
+                    new_method_call(systemd, 'LoadUnit', 's', ('ModemManager.service',)),
+                    timeout=_MM_QUERY_TIMEOUT)
+                unit = DBusAddress(reply.body[0],
+                                   bus_name='org.freedesktop.systemd1',
+                                   interface='org.freedesktop.DBus.Properties')
+                get_state = new_method_call(unit, 'Get', 'ss', ('org.freedesktop.systemd1.Unit', 'ActiveState'))
+
+                deadline = time.monotonic() + _MM_CONTROL_TIMEOUT
+                while time.monotonic() < deadline:
+                    reply = connection.send_and_get_reply(get_state, timeout=_MM_QUERY_TIMEOUT)
+                    # The property arrives as a (signature, value) variant
+                    if reply.body[0][1] in target_states:
+                        return True
+                    time.sleep(0.1)
+            return False
+        except Exception:
+            return False
+
     @staticmethod
     def stop_temporarily() -> bool:
         """Temporarily stop ModemManager (requires sudo)"""
-        if not IS_LINUX:
+        if _LinuxModemManagerHelper._systemd_unit_call('StopUnit', ('inactive', 'failed')):
+            _LinuxModemManagerHelper.clear_cache()
+            return True
+
+        if not _SYSTEMCTL_BIN:
             return False
 
         try:
             result = subprocess.run(
-                ['systemctl', 'stop', 'ModemManager'],
-                capture_output=True,
-                timeout=5
+                [_SYSTEMCTL_BIN, 'stop', 'ModemManager'],
+                timeout=_MM_CONTROL_TIMEOUT,
+                **_RUN_KW
             )
+            _LinuxModemManagerHelper.clear_cache()
             return result.returncode == 0
         except Exception:
             return False
@@ -168,19 +547,88 @@ class ModemManagerHelper:
     @staticmethod
     def restart() -> bool:
         """Restart ModemManager"""
-        if not IS_LINUX:
+        if _LinuxModemManagerHelper._systemd_unit_call('StartUnit', ('active',)):
+            _LinuxModemManagerHelper.clear_cache()
+            return True
+
+        if not _SYSTEMCTL_BIN:
             return False
 
         try:
             result = subprocess.run(
-                ['systemctl', 'start', 'ModemManager'],
-                capture_output=True,
-                timeout=5
+                [_SYSTEMCTL_BIN, 'start', 'ModemManager'],
+                timeout=_MM_CONTROL_TIMEOUT,
+                **_RUN_KW
             )
+            _LinuxModemManagerHelper.clear_cache()
             return result.returncode == 0
         except Exception:
             return False
 
+    @staticmethod
+    def clear_cache():
+        """Forget cached ModemManager state after it has been stopped or started"""
+        _LinuxModemManagerHelper.is_running.cache_clear()
+        _LinuxModemManagerHelper.get_managed_ports.cache_clear()
+
+
+class _NoModemManagerHelper:
+    """Stand-in for _LinuxModemManagerHelper on platforms without ModemManager"""
+
+    @staticmethod
+    def is_running() -> bool:
+        return False
+
+    @staticmethod
+    def is_blocking_port(port: str) -> bool:
+        return False
+
+    @staticmethod
+    def get_blocked_ports(ports: List[str]) -> List[str]:
+        return []
+
+    @staticmethod
+    def get_managed_ports() -> List[str]:
+        return []
+
+    @staticmethod
+    def stop_temporarily() -> bool:
+        return False
+
+    @staticmethod
+    def restart() -> bool:
+        return False
+
+    @staticmethod
+    def clear_cache():
+        pass
+
+
+# ModemManager is Linux-only; elsewhere use the no-op helper
+ModemManagerHelper = _LinuxModemManagerHelper if IS_LINUX else _NoModemManagerHelper
+
+
+class SerialLatencyHelper:
+    """Helper to put USB-serial adapters into low-latency mode on Linux"""
+
+    @staticmethod
+    def set_low_latency(port_path: str) -> bool:
+        """Drop the USB-serial latency timer to 1 ms; returns True if it was applied"""
+        if not IS_LINUX:
+            return False
+
+        # Only usb-serial drivers (FTDI, CP210x, option...) have a latency timer
+        device_dir = f"/sys/bus/usb-serial/devices/{os.path.basename(port_path)}"
+        if not os.path.isdir(device_dir):
+            return False
+
+        try:
+            with open(os.path.join(device_dir, 'latency_timer'), 'w') as f:
+                f.write('1')
+            return True
+        except OSError:
+            return False  # Not writable without root, or driver has no latency timer
+
 
 @dataclass
 class ATResponse:
@@ -188,99 +636,233 @@ class ATResponse:
     command: str
     raw_response: str
     parsed_data: Dict
-    timestamp: datetime
+    timestamp: float  # time.time() epoch seconds
     success: bool
     error: Optional[str] = None
+    # Set when the command went out in a ';'-chained line; raw_response is then
+    # the whole chain's reply and parsed_data['raw'] holds this command's lines
+    chained_command: Optional[str] = None
+
+    @property
+    def reply(self) -> str:
+        """This command's own reply, without the other commands of a chain"""
+        return self.parsed_data.get('raw', '') if self.chained_command else self.raw_response
+
+    @property
+    def timestamp_dt(self) -> datetime:
+        """Timestamp as a local datetime, for display"""
+        return datetime.fromtimestamp(self.timestamp)
 
 
 class ModemConnection:
     """Handle serial communication with cellular modem"""
 
-    def __init__(self, port: str = "/dev/ttyUSB2", baudrate: int = 115200, timeout: int = 5):
+    def __init__(self, port: str = "/dev/ttyUSB2", baudrate: int = 115200, timeout: int = _DEFAULT_SERIAL_TIMEOUT):
         self.port = port
         self.baudrate = baudrate
         self.timeout = timeout
         self.connection: Optional[serial.Serial] = None
         self.rtscts = None  # Will be auto-detected
+        self._fd: Optional[int] = None  # Raw descriptor for select(), None on Windows
 
-    def connect(self, quick_test: bool = False) -> bool:
+    def connect(self, rtscts: Optional[bool] = None) -> bool:
         """Establish serial connection to modem
 
         Args:
-            quick_test: If True, use minimal retries and faster timeouts for detection
+            rtscts: Only try this flow control setting (e.g. a saved one) instead of off then on
         """
-        # For quick testing, only try one rtscts setting and minimal retries
-        rtscts_settings = [False] if quick_test else [False, True]
-        max_attempts = 1 if quick_test else 3
-        init_sleep = 0.1 if quick_test else 0.5
-        test_sleep = 0.2 if quick_test else 0.5
-
+        rtscts_settings = (False, True) if rtscts is None else (rtscts,)
         for rtscts_setting in rtscts_settings:
             try:
-                self.connection = serial.Serial(
-                    port=self.port,
-                    baudrate=self.baudrate,
-                    timeout=self.timeout,
-                    write_timeout=self.timeout,
-                    bytesize=serial.EIGHTBITS,
-                    parity=serial.PARITY_NONE,
-                    stopbits=serial.STOPBITS_ONE,
-                    rtscts=rtscts_setting,
-                    xonxoff=False,
-                    dsrdtr=False,
-                    exclusive=False  # Allow shared access to prevent blocking on Linux
-                )
-                time.sleep(init_sleep)
+                self._open_serial(rtscts_setting)
 
                 # Clear any pending data
-                self.connection.reset_input_buffer()
-                self.connection.reset_output_buffer()
-                if not quick_test:
-                    time.sleep(0.2)
+                self._flush_buffers()
 
                 # Test with AT command - try multiple times for broken pipe issues
-                for attempt in range(max_attempts):
+                for attempt in range(3):
                     try:
+                        # No flush(): tcdrain() never returns while CTS holds the line
                         self.connection.write(b'AT\r\n')
-                        self.connection.flush()
-                        time.sleep(test_sleep)
-                        response = self.connection.read(self.connection.in_waiting or 100).decode('utf-8',
-                                                                                                  errors='ignore')
+                        response = self._read_until(0.5).decode('utf-8', errors='ignore')
 
                         if 'OK' in response or 'AT' in response:
                             # Connection works with this flow control setting
                             self.rtscts = rtscts_setting
                             # Clear buffers again for clean slate
-                            self.connection.reset_input_buffer()
-                            self.connection.reset_output_buffer()
+                            self._flush_buffers()
                             return True
 
-                    except (BrokenPipeError, OSError) as e:
-                        if attempt < max_attempts - 1 and not quick_test:
+                    except (BrokenPipeError, OSError):
+                        if attempt < 2:
                             time.sleep(0.3)
                             continue
-                        else:
-                            if not quick_test:
-                                raise
-                            break
+                        raise
 
                 # No response, try next setting
-                self.connection.close()
+                self.disconnect()
 
             except Exception as e:
-                if self.connection and self.connection.is_open:
-                    self.connection.close()
-                # Only show error if not quick test and this was the last attempt
-                if rtscts_setting == rtscts_settings[-1] and not quick_test:
+                self.disconnect()
+                # Only show error if this was the last attempt
+                if rtscts_setting == rtscts_settings[-1]:
                     console.print(f"[red]Connection Error: {e}[/red]")
                 continue
 
+        self._fd = None
+        return False
+
+    def _open_serial(self, rtscts: bool):
+        """Open the serial port with this connection's settings"""
+        self.connection = serial.Serial(
+            port=self.port,
+            baudrate=self.baudrate,
+            timeout=self.timeout,
+            write_timeout=self.timeout,
+            bytesize=serial.EIGHTBITS,
+            parity=serial.PARITY_NONE,
+            stopbits=serial.STOPBITS_ONE,
+            rtscts=rtscts,
+            xonxoff=False,
+            dsrdtr=False,
+            exclusive=False  # Allow shared access to prevent blocking on Linux
+        )
+        self._fd = None if IS_WINDOWS else self.connection.fileno()
+
+        if IS_LINUX:
+            # ASYNC_LOW_LATENCY drops USB-serial RX batching (16 ms on FTDI) to ~1 ms
+            try:
+                self.connection.set_low_latency_mode(True)
+            except Exception:
+                # Driver rejects the ioctl, try its sysfs latency timer instead
+                SerialLatencyHelper.set_low_latency(self.port)
+
+    def probe_baudrates(self, baudrates: List[int], wait_time: float = 1.0) -> Optional[int]:
+        """Open the port once per flow control setting and send AT at each baud rate in turn
+
+        Returns the first rate that answers, leaving the port open at that rate,
+        or None with the port closed.
+        """
+        for rtscts_setting in (False, True):
+            try:
+                self._open_serial(rtscts_setting)
+            except Exception:
+                self._fd = None
+                return None
+
+            for baudrate in baudrates:
+                try:
+                    # Retuning an open port avoids a close/open and driver re-init per rate
+                    self.connection.baudrate = baudrate
+                    self._flush_buffers()
+                    self.connection.write(b'AT\r\n')
+                    response = self._read_until(wait_time)
+                except (serial.SerialException, OSError):
+                    break
+
+                if b'OK' in response:
+                    self.baudrate = baudrate
+                    self.rtscts = rtscts_setting
+                    return baudrate
+
+            # No rate answered, try next setting
+            self.disconnect()
+
+        return None
+
+    def probe_identity(self, command: str, wait_time: float = 0.5) -> bool:
+        """Open the port and send a single identity query as the only handshake
+
+        Success needs OK plus at least one answer line besides the echo, so AT-speaking
+        devices that are not modems do not pass. Leaves the port open on success,
+        closed otherwise.
+        """
+        try:
+            self._open_serial(rtscts=False)
+            self._flush_buffers()
+        except Exception:
+            self.disconnect()
+            return False
+
+        result = self.send_at_command(command, wait_time)
+        answered = any(line.strip() not in ('', 'OK', command)
+                       for line in result.raw_response.splitlines())
+        if result.success and answered:
+            self.rtscts = False
+            return True
+
+        self.disconnect()
         return False
 
     def disconnect(self):
         """Close serial connection"""
         if self.connection and self.connection.is_open:
+            # Unsent bytes (AT stuck behind a deasserted CTS) would make close()
+            # wait out the tty closing_wait, 30 s by default
+            try:
+                if HAS_TERMIOS and self._fd is not None:
+                    termios.tcflush(self._fd, termios.TCOFLUSH)
+                else:
+                    self.connection.reset_output_buffer()
+            except Exception:
+                pass
             self.connection.close()
+        self._fd = None
+
+    def set_timeout(self, timeout: int):
+        """Change the serial read/write timeout, including on an already open port"""
+        self.timeout = timeout
+        if self.connection and self.connection.is_open:
+            self.connection.timeout = timeout
+            self.connection.write_timeout = timeout
+
+    def _flush_buffers(self):
+        """Discard pending input and output on the serial port"""
+        if HAS_TERMIOS and self._fd is not None:
+            termios.tcflush(self._fd, termios.TCIOFLUSH)
+        else:
+            self.connection.reset_input_buffer()
+            self.connection.reset_output_buffer()
+
+    def _wait_readable(self, timeout: float) -> bool:
+        """Wait until the serial descriptor has data to read or timeout expires"""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        return bool(ready)
+
+    def _read_until(self, timeout: float) -> bytes:
+        """Read from the port until a final result code arrives or timeout expires"""
+        buf = bytearray()
+        scanned = 0
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            if self._fd is None:
+                # select() does not support serial handles on Windows
+                waiting = self.connection.in_waiting
+                if not waiting:
+                    time.sleep(min(0.01, remaining))
+                    continue
+                buf += self.connection.read(waiting)
+            else:
+                if not self._wait_readable(remaining):
+                    break
+                try:
+                    chunk = os.read(self._fd, 65536)
+                except BlockingIOError:
+                    continue
+                if not chunk:
+                    break
+                buf += chunk
+
+            # Only rescan from the start of the last line seen before this chunk
+            if _RE_AT_FINAL.search(buf, max(0, buf.rfind(b'\n', 0, scanned))):
+                break
+            scanned = len(buf)
+
+        return bytes(buf)
 
     def send_at_command(self, command: str, wait_time: float = 1.0) -> ATResponse:
         """Send AT command and return parsed response"""
@@ -289,7 +871,7 @@ class ModemConnection:
                 command=command,
                 raw_response="",
                 parsed_data={},
-                timestamp=datetime.now(),
+                timestamp=time.time(),
                 success=False,
                 error="No connection"
             )
@@ -304,23 +886,19 @@ class ModemConnection:
 
             # Send command
             self.connection.write(command.encode('utf-8'))
-            time.sleep(wait_time)
-
-            # Read response
-            response = ""
-            while self.connection.in_waiting:
-                response += self.connection.read(self.connection.in_waiting).decode('utf-8', errors='ignore')
-                time.sleep(0.1)
 
-            # Parse response
-            success = "OK" in response and "ERROR" not in response
-            error = "ERROR" if "ERROR" in response else None
+            # Read response; result codes are ASCII, so check them before decoding
+            raw = self._read_until(wait_time)
+            failed = b"ERROR" in raw
+            success = b"OK" in raw and not failed
+            error = "ERROR" if failed else None
+            response = raw.decode('utf-8', errors='ignore')
 
             return ATResponse(
                 command=command.strip(),
                 raw_response=response,
                 parsed_data=self._parse_response(command.strip(), response),
-                timestamp=datetime.now(),
+                timestamp=time.time(),
                 success=success,
                 error=error
             )
@@ -330,272 +908,263 @@ class ModemConnection:
                 command=command,
                 raw_response="",
                 parsed_data={},
-                timestamp=datetime.now(),
+                timestamp=time.time(),
                 success=False,
                 error=str(e)
             )
 
+    def send_at_chain(self, commands: List[str], wait_time: float = 1.0) -> List[ATResponse]:
+        """Send several AT commands as one ';'-chained line and split the reply per command
+
+        Only one command with an untagged reply (+CGMI, +CGMR...) goes into the chain;
+        any further ones are sent on their own afterwards. Falls back to sending the
+        commands one at a time if the chained line fails.
+        """
+        chain = []
+        untagged_chained = False
+        for cmd in commands:
+            if self._command_prefix(cmd) in _UNTAGGED_REPLY_PREFIXES:
+                if untagged_chained:
+                    continue
+                untagged_chained = True
+            chain.append(cmd)
+
+        sent = dict(zip(chain, self._send_chained(chain, wait_time)))
+        for cmd in commands:
+            if cmd not in sent:
+                sent[cmd] = self.send_at_command(cmd, wait_time)
+        return [sent[cmd] for cmd in commands]
+
+    def _send_chained(self, commands: List[str], wait_time: float) -> List[ATResponse]:
+        """Send commands as one chained line, or one at a time if it fails"""
+        if len(commands) < 2:
+            return [self.send_at_command(cmd, wait_time) for cmd in commands]
+
+        # AT+CGATT?;+CGACT?;+CGPADDR - only the first command keeps its AT prefix
+        chained = commands[0] + ''.join(';' + cmd[2:] for cmd in commands[1:])
+        combined = self.send_at_command(chained, wait_time)
+        if not combined.success:
+            return [self.send_at_command(cmd, wait_time) for cmd in commands]
+
+        # The chain ended in OK, and 27.007 aborts a chain at the first failing
+        # command, so every command in it succeeded
+        responses = []
+        for cmd, lines in zip(commands, self._split_chained_response(commands, chained, combined.raw_response)):
+            responses.append(ATResponse(
+                command=cmd,
+                raw_response=combined.raw_response,
+                parsed_data=self._parse_response(cmd, '\r\n'.join(lines)),
+                timestamp=combined.timestamp,
+                success=True,
+                chained_command=chained
+            ))
+        return responses
+
+    @staticmethod
+    def _command_prefix(command: str) -> str:
+        """AT prefix of a command (AT+CREG? -> +CREG), or '' for basic commands"""
+        match = _RE_AT_PREFIX.match(command)
+        return match.group(1) if match else ''
+
+    @classmethod
+    def _split_chained_response(cls, commands: List[str], chained: str, response: str) -> List[List[str]]:
+        """Assign the body lines of a chained reply to the command that produced them"""
+        prefixes = [cls._command_prefix(cmd) for cmd in commands]
+        # send_at_chain puts at most one command with untagged replies in a chain
+        untagged = next((idx for idx, prefix in enumerate(prefixes) if prefix in _UNTAGGED_REPLY_PREFIXES), None)
+
+        blocks = [[] for _ in commands]
+        cursor = 0
+        for line in response.splitlines():
+            line = line.strip()
+            if not line or line == chained or line == 'OK':
+                continue
+
+            # Tagged lines (+CGACT: ...) belong to the next command with that prefix
+            tag = line.split(':', 1)[0] if line.startswith('+') else None
+            if tag and tag in prefixes[cursor:]:
+                cursor = prefixes.index(tag, cursor)
+                blocks[cursor].append(line)
+                continue
+
+            # Bare values (CGMI, CIMI, ...) all belong to that command, however many
+            # lines it prints
+            if untagged is not None:
+                blocks[untagged].append(line)
+                continue
+
+            # Otherwise they fill the next command with no output yet
+            while cursor < len(commands) - 1 and blocks[cursor]:
+                cursor += 1
+            blocks[cursor].append(line)
+
+        return blocks
+
     def _parse_response(self, command: str, response: str) -> Dict:
         """Parse AT command response into structured data"""
         parsed = {"raw": response}
 
-        # Remove echo and OK/ERROR
-        lines = [line.strip() for line in response.split('\n') if line.strip()]
-        lines = [line for line in lines if line not in [command, 'OK', 'ERROR', '']]
+        # Remove echo, blank lines and OK/ERROR in a single pass
+        lines = []
+        for line in response.splitlines():
+            line = line.strip()
+            if line and line != command and line != 'OK' and line != 'ERROR':
+                lines.append(line)
 
         if not lines:
             return parsed
 
-        # Parse based on command type
-        if '+COPS' in command:
-            parsed.update(self._parse_cops(lines))
-        elif '+CREG' in command or '+CGREG' in command or '+CEREG' in command:
-            parsed.update(self._parse_registration(lines))
-        elif '+CSQ' in command:
-            parsed.update(self._parse_csq(lines))
-        elif '+CGDCONT' in command:
-            parsed.update(self._parse_cgdcont(lines))
-        elif '+CPIN' in command:
-            parsed.update(self._parse_cpin(lines))
-        elif '+CIMI' in command:
-            parsed['imsi'] = lines[0] if lines else ''
-        elif '+CCID' in command or '+ICCID' in command or '+QCCID' in command:
-            parsed['iccid'] = re.sub(r'[^0-9]', '', lines[0]) if lines else ''
-        elif '+CGMI' in command:
-            parsed['manufacturer'] = lines[0] if lines else ''
-        elif '+CGMM' in command:
-            parsed['model'] = lines[0] if lines else ''
-        elif '+CGMR' in command:
-            parsed['firmware'] = lines[0] if lines else ''
-        elif '+CGSN' in command:
-            parsed['imei'] = lines[0] if lines else ''
-        elif 'I' == command or 'ATI' in command:
+        # Parse based on the command's AT prefix (e.g. AT+CREG? -> +CREG)
+        match = _RE_AT_PREFIX.match(command)
+        prefix = match.group(1) if match else ''
+        parser = self._RESPONSE_PARSERS.get(prefix)
+        if parser:
+            parsed.update(parser(self, response))
+        elif prefix in _FIRST_LINE_FIELDS:
+            parsed[_FIRST_LINE_FIELDS[prefix]] = lines[0]
+        elif prefix in _ICCID_COMMANDS:
+            parsed['iccid'] = _RE_ICCID_NONDIGIT.sub('', lines[0])
+        elif 'I' == command or command.startswith('ATI'):
             parsed['info'] = '\n'.join(lines)
-        # Quectel-specific commands
-        elif '+QENG' in command:
-            parsed.update(self._parse_qeng(lines))
-        elif '+QNWINFO' in command:
-            parsed.update(self._parse_qnwinfo(lines))
-        elif '+QSPN' in command:
-            parsed.update(self._parse_qspn(lines))
 
         return parsed
 
-    def _parse_qeng(self, lines: List[str]) -> Dict:
+    def _parse_qeng(self, response: str) -> Dict:
         """Parse Quectel +QENG serving cell information"""
         result = {}
-        for line in lines:
-            if '+QENG:' in line:
-                parts = line.replace('+QENG:', '').strip().split(',')
-                if len(parts) > 0:
-                    result['servingcell_type'] = parts[0].strip('"')
-                    if parts[0].strip('"') == 'servingcell':
-                        # LTE serving cell info
-                        if len(parts) >= 15:
-                            result['state'] = parts[1].strip('"')
-                            result['mode'] = parts[2].strip('"')
-                            result['mcc'] = parts[4].strip('"')
-                            result['mnc'] = parts[5].strip('"')
-                            result['cellid'] = parts[6].strip('"')
-                            result['pcid'] = parts[7]
-                            result['earfcn'] = parts[8]
-                            result['freq_band'] = parts[9]
-                            result['ul_bandwidth'] = parts[10]
-                            result['dl_bandwidth'] = parts[11]
-                            result['tac'] = parts[12].strip('"')
-                            result['rsrp'] = f"{parts[13]} dBm"
-                            result['rsrq'] = f"{parts[14]} dB"
-                            result['rssi'] = f"{parts[15]} dBm" if len(parts) > 15 else ''
-                            result['sinr'] = f"{parts[16]} dB" if len(parts) > 16 else ''
+        for line in response.splitlines():
+            line = line.strip()
+            if not line.startswith('+QENG:'):
+                continue
+
+            # LTE serving cell info, matched in one pass
+            match = _RE_QENG_SERVINGCELL.search(line)
+            if match:
+                result['servingcell_type'] = 'servingcell'
+                for (key, fmt), value in zip(_QENG_SERVINGCELL_FIELDS, match.groups()):
+                    result[key] = fmt.format(value) if value is not None else ''
+            else:
+                result['servingcell_type'] = line[line.index(':') + 1:].split(',', 1)[0].strip().strip('"')
         return result
 
-    def _parse_qnwinfo(self, lines: List[str]) -> Dict:
+    def _parse_qnwinfo(self, response: str) -> Dict:
         """Parse Quectel +QNWINFO network information"""
         result = {}
-        for line in lines:
-            if '+QNWINFO:' in line:
-                # +QNWINFO: <Act>,<oper>,<band>,<channel>
-                match = re.search(r'\+QNWINFO:\s*"([^"]*)",?"([^"]*)",?"([^"]*)",?(\d+)', line)
-                if match:
-                    result['access_tech'] = match.group(1)
-                    result['operator'] = match.group(2)
-                    result['band'] = match.group(3)
-                    result['channel'] = match.group(4)
+        # +QNWINFO: <Act>,<oper>,<band>,<channel>
+        match = _RE_QNWINFO.search(response)
+        if match:
+            result['access_tech'] = match.group(1)
+            result['operator'] = match.group(2)
+            result['band'] = match.group(3)
+            result['channel'] = match.group(4)
         return result
 
-    def _parse_qspn(self, lines: List[str]) -> Dict:
+    def _parse_qspn(self, response: str) -> Dict:
         """Parse Quectel +QSPN service provider name"""
         result = {}
-        for line in lines:
-            if '+QSPN:' in line:
-                match = re.search(r'\+QSPN:\s*"([^"]*)",?"([^"]*)",?"([^"]*)"', line)
-                if match:
-                    result['fnn'] = match.group(1)  # Full name
-                    result['snn'] = match.group(2)  # Short name
-                    result['spn'] = match.group(3)  # Service provider name
+        match = _RE_QSPN.search(response)
+        if match:
+            result['fnn'] = match.group(1)  # Full name
+            result['snn'] = match.group(2)  # Short name
+            result['spn'] = match.group(3)  # Service provider name
         return result
 
-    def _parse_cops(self, lines: List[str]) -> Dict:
+    def _parse_cops(self, response: str) -> Dict:
         """Parse +COPS operator selection response"""
         result = {}
-        for line in lines:
-            if '+COPS:' in line:
-                # +COPS: <mode>[,<format>,<oper>[,<AcT>]]
-                match = re.search(r'\+COPS:\s*(\d+)(?:,(\d+),"([^"]*)"(?:,(\d+))?)?', line)
-                if match:
-                    mode = int(match.group(1))
-                    result['mode'] = mode
-                    result['mode_text'] = {
-                        0: 'Automatic',
-                        1: 'Manual',
-                        2: 'Deregister',
-                        3: 'Set format only',
-                        4: 'Manual/Automatic'
-                    }.get(mode, f'Unknown ({mode})')
-
-                    if match.group(2):
-                        result['format'] = int(match.group(2))
-                    if match.group(3):
-                        result['operator'] = match.group(3)
-                    if match.group(4):
-                        act = int(match.group(4))
-                        result['access_tech'] = act
-                        result['access_tech_text'] = {
-                            0: 'GSM',
-                            1: 'GSM Compact',
-                            2: 'UTRAN',
-                            3: 'GSM w/EGPRS',
-                            4: 'UTRAN w/HSDPA',
-                            5: 'UTRAN w/HSUPA',
-                            6: 'UTRAN w/HSDPA and HSUPA',
-                            7: 'E-UTRAN',
-                            8: 'EC-GSM-IoT',
-                            9: 'E-UTRAN (NB-S1 mode)',
-                            10: 'E-UTRA connected to 5GCN',
-                            11: 'NR connected to 5GCN'
-                        }.get(act, f'Unknown ({act})')
+        # +COPS: <mode>[,<format>,<oper>[,<AcT>]]
+        match = _RE_COPS.search(response)
+        if match:
+            mode = int(match.group(1))
+            result['mode'] = mode
+            result['mode_text'] = _COPS_MODE_TEXT[mode] if mode < len(_COPS_MODE_TEXT) else f'Unknown ({mode})'
+
+            if match.group(2):
+                result['format'] = int(match.group(2))
+            if match.group(3):
+                result['operator'] = match.group(3)
+            if match.group(4):
+                act = int(match.group(4))
+                result['access_tech'] = act
+                result['access_tech_text'] = _ACT_TEXT[act] if act < len(_ACT_TEXT) else f'Unknown ({act})'
         return result
 
-    def _parse_registration(self, lines: List[str]) -> Dict:
+    def _parse_registration(self, response: str) -> Dict:
         """Parse +CREG/+CGREG/+CEREG network registration response"""
         result = {}
-        for line in lines:
-            match = re.search(r'\+(CREG|CGREG|CEREG):\s*(\d+)(?:,(\d+))?(?:,"([0-9A-F]+)","([0-9A-F]+)")?(?:,(\d+))?',
-                              line)
-            if match:
-                reg_type = match.group(1).lower()
-                n = int(match.group(2))
-                stat = int(match.group(3)) if match.group(3) else n
-
-                result[f'{reg_type}_status'] = stat
-                result[f'{reg_type}_status_text'] = {
-                    0: 'Not registered, not searching',
-                    1: 'Registered, home network',
-                    2: 'Not registered, searching',
-                    3: 'Registration denied',
-                    4: 'Unknown',
-                    5: 'Registered, roaming'
-                }.get(stat, f'Unknown ({stat})')
-
-                if match.group(4):
-                    result['lac'] = match.group(4)
-                if match.group(5):
-                    result['ci'] = match.group(5)
-                if match.group(6):
-                    act = int(match.group(6))
-                    result['act'] = act
-                    result['act_text'] = {
-                        0: 'GSM',
-                        1: 'GSM Compact',
-                        2: 'UTRAN',
-                        3: 'GSM w/EGPRS',
-                        4: 'UTRAN w/HSDPA',
-                        5: 'UTRAN w/HSUPA',
-                        6: 'UTRAN w/HSDPA and HSUPA',
-                        7: 'E-UTRAN',
-                        8: 'EC-GSM-IoT',
-                        9: 'E-UTRAN (NB-S1 mode)'
-                    }.get(act, f'Unknown ({act})')
+        match = _RE_REG.search(response)
+        if match:
+            reg_type = match.group(1).lower()
+            n = int(match.group(2))
+            stat = int(match.group(3)) if match.group(3) else n
+
+            result[f'{reg_type}_status'] = stat
+            result[f'{reg_type}_status_text'] = _REG_STATUS_TEXT[stat] if stat < len(_REG_STATUS_TEXT) else f'Unknown ({stat})'
+
+            if match.group(4):
+                result['lac'] = match.group(4)
+            if match.group(5):
+                result['ci'] = match.group(5)
+            if match.group(6):
+                act = int(match.group(6))
+                result['act'] = act
+                result['act_text'] = _ACT_TEXT[act] if act < len(_ACT_TEXT) else f'Unknown ({act})'
         return result
 
-    def _parse_csq(self, lines: List[str]) -> Dict:
+    def _parse_csq(self, response: str) -> Dict:
         """Parse +CSQ signal quality response"""
         result = {}
-        for line in lines:
-            match = re.search(r'\+CSQ:\s*(\d+),(\d+)', line)
-            if match:
-                rssi = int(match.group(1))
-                ber = int(match.group(2))
-
-                result['rssi_raw'] = rssi
-                result['ber_raw'] = ber
-
-                # Convert RSSI to dBm
-                if rssi == 0:
-                    result['rssi_dbm'] = '<= -113 dBm'
-                    result['signal_quality'] = 'Very Poor'
-                elif rssi == 1:
-                    result['rssi_dbm'] = '-111 dBm'
-                    result['signal_quality'] = 'Very Poor'
-                elif 2 <= rssi <= 30:
-                    dbm = -109 + (rssi - 2) * 2
-                    result['rssi_dbm'] = f'{dbm} dBm'
-                    if rssi < 10:
-                        result['signal_quality'] = 'Poor'
-                    elif rssi < 15:
-                        result['signal_quality'] = 'Fair'
-                    elif rssi < 20:
-                        result['signal_quality'] = 'Good'
-                    else:
-                        result['signal_quality'] = 'Excellent'
-                elif rssi == 31:
-                    result['rssi_dbm'] = '>= -51 dBm'
-                    result['signal_quality'] = 'Excellent'
-                else:
-                    result['rssi_dbm'] = 'Unknown'
-                    result['signal_quality'] = 'Unknown'
+        match = _RE_CSQ.search(response)
+        if match:
+            rssi = int(match.group(1))
+            ber = int(match.group(2))
 
-                # BER interpretation
-                if ber == 99:
-                    result['ber_text'] = 'Unknown or not detectable'
-                else:
-                    result[
-                        'ber_text'] = f'{ber} ({["<0.2%", "0.2-0.4%", "0.4-0.8%", "0.8-1.6%", "1.6-3.2%", "3.2-6.4%", "6.4-12.8%", ">12.8%"][min(ber, 7)]})'
+            result['rssi_raw'] = rssi
+            result['ber_raw'] = ber
+
+            result['rssi_dbm'], result['signal_quality'], result['ber_text'] = _csq_interpret(rssi, ber)
 
         return result
 
-    def _parse_cgdcont(self, lines: List[str]) -> Dict:
+    def _parse_cgdcont(self, response: str) -> Dict:
         """Parse +CGDCONT PDP context response"""
         result = {'contexts': []}
-        for line in lines:
-            match = re.search(r'\+CGDCONT:\s*(\d+),"([^"]*)","([^"]*)"(?:,"([^"]*)")?', line)
-            if match:
-                context = {
-                    'cid': int(match.group(1)),
-                    'pdp_type': match.group(2),
-                    'apn': match.group(3),
-                    'pdp_addr': match.group(4) if match.group(4) else ''
-                }
-                result['contexts'].append(context)
+        for match in _RE_CGDCONT.finditer(response):
+            context = {
+                'cid': int(match.group(1)),
+                'pdp_type': match.group(2),
+                'apn': match.group(3),
+                'pdp_addr': match.group(4) if match.group(4) else ''
+            }
+            result['contexts'].append(context)
         return result
 
-    def _parse_cpin(self, lines: List[str]) -> Dict:
+    def _parse_cpin(self, response: str) -> Dict:
         """Parse +CPIN SIM status response"""
         result = {}
-        for line in lines:
-            if '+CPIN:' in line:
-                status = line.split(':')[1].strip()
-                result['sim_status'] = status
-                result['sim_ready'] = status == 'READY'
-                result['sim_status_text'] = {
-                    'READY': 'SIM is ready',
-                    'SIM PIN': 'SIM requires PIN',
-                    'SIM PUK': 'SIM requires PUK',
-                    'SIM PIN2': 'SIM requires PIN2',
-                    'SIM PUK2': 'SIM requires PUK2'
-                }.get(status, status)
+        match = _RE_CPIN.search(response)
+        if match:
+            status = match.group(1).strip()
+            result['sim_status'] = status
+            result['sim_ready'] = status == 'READY'
+            result['sim_status_text'] = _SIM_STATUS_TEXT.get(status, status)
         return result
 
+    # AT command prefix -> parser taking the raw response
+    _RESPONSE_PARSERS = {
+        '+COPS': _parse_cops,
+        '+CREG': _parse_registration,
+        '+CGREG': _parse_registration,
+        '+CEREG': _parse_registration,
+        '+CSQ': _parse_csq,
+        '+CGDCONT': _parse_cgdcont,
+        '+CPIN': _parse_cpin,
+        # Quectel-specific commands
+        '+QENG': _parse_qeng,
+        '+QNWINFO': _parse_qnwinfo,
+        '+QSPN': _parse_qspn,
+    }
+
 
 class DiagnosticTests:
     """Comprehensive diagnostic test suite"""
@@ -605,11 +1174,14 @@ class DiagnosticTests:
         self.results = []
         self.modem_vendor = None
         self.modem_model = None
+        self.vendor_responses = {}
 
     def detect_modem_vendor(self):
         """Detect modem manufacturer and model for vendor-specific optimizations"""
+        # Sent separately: both replies are untagged, so a chained reply cannot be split
         manu_result = self.modem.send_at_command("AT+CGMI")
         model_result = self.modem.send_at_command("AT+CGMM")
+        self.vendor_responses = {"AT+CGMI": manu_result, "AT+CGMM": model_result}
 
         if 'manufacturer' in manu_result.parsed_data:
             manu = manu_result.parsed_data['manufacturer'].upper()
@@ -636,46 +1208,65 @@ class DiagnosticTests:
         # Detect vendor first
         self.detect_modem_vendor()
 
-        # Standard tests
-        tests = [
-            ("AT", "Basic communication test"),
-            ("ATI", "Modem information"),
-            ("AT+CGMI", "Manufacturer identification"),
-            ("AT+CGMM", "Model identification"),
-            ("AT+CGMR", "Firmware version"),
-            ("AT+CGSN", "IMEI"),
-            ("AT+CPIN?", "SIM status"),
-            ("AT+CCID", "ICCID (SIM serial)"),
-            ("AT+CIMI", "IMSI"),
-            ("AT+CSQ", "Signal quality"),
-            ("AT+CREG?", "Network registration (CS)"),
-            ("AT+CGREG?", "GPRS registration (PS)"),
-            ("AT+CEREG?", "EPS registration (LTE)"),
-            ("AT+COPS?", "Operator selection"),
-            ("AT+CGDCONT?", "PDP context"),
+        # Standard tests. Extended commands in the same group are chained into one
+        # round trip, except that send_at_chain sends a second untagged-reply command
+        # (e.g. AT+CGSN after AT+CGMR) on its own; it also falls back to one at a
+        # time if the modem refuses the chain
+        test_groups = [
+            [("AT", "Basic communication test")],
+            [("ATI", "Modem information")],
+            [("AT+CGMI", "Manufacturer identification")],
+            [("AT+CGMM", "Model identification")],
+            [("AT+CGMR", "Firmware version"),
+             ("AT+CGSN", "IMEI")],
+            [("AT+CPIN?", "SIM status"),
+             ("AT+CCID", "ICCID (SIM serial)"),
+             ("AT+CIMI", "IMSI")],
+            [("AT+CSQ", "Signal quality"),
+             ("AT+CREG?", "Network registration (CS)"),
+             ("AT+CGREG?", "GPRS registration (PS)"),
+             ("AT+CEREG?", "EPS registration (LTE)"),
+             ("AT+COPS?", "Operator selection"),
+             ("AT+CGDCONT?", "PDP context")],
         ]
 
-        # Add vendor-specific tests
+        # Add vendor-specific tests, sent one at a time
         if self.modem_vendor == 'Quectel':
-            tests.extend(self._get_quectel_tests())
+            test_groups.extend([test] for test in self._get_quectel_tests())
         elif self.modem_vendor == 'Sierra Wireless':
-            tests.extend(self._get_sierra_tests())
+            test_groups.extend([test] for test in self._get_sierra_tests())
         elif self.modem_vendor == 'u-blox':
-            tests.extend(self._get_ublox_tests())
+            test_groups.extend([test] for test in self._get_ublox_tests())
 
+        # Diagnostics finish in well under a second per command, so a low
+        # refresh rate keeps the spinner from dominating CPU on a Pi
         with Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
-                console=console
+                console=console,
+                refresh_per_second=4
         ) as progress:
-            task = progress.add_task("[cyan]Running diagnostic tests...", total=len(tests))
+            task = progress.add_task("[cyan]Running diagnostic tests...",
+                                     total=sum(len(group) for group in test_groups))
+
+            covered_fields = set()
+            for group in test_groups:
+                progress.update(task, description=f"[cyan]{', '.join(description for _, description in group)}")
+
+                # Skip fields already answered by an earlier command (e.g. ICCID via AT+CCID)
+                commands = [cmd for cmd, _ in group if _DIAG_FIELD_BY_COMMAND.get(cmd) not in covered_fields]
+
+                # Reuse the identification responses from vendor detection
+                to_send = [cmd for cmd in commands if cmd not in self.vendor_responses]
+                sent = dict(zip(to_send, self.modem.send_at_chain(to_send, wait_time=max(1.0, len(to_send)))))
 
-            for cmd, description in tests:
-                progress.update(task, description=f"[cyan]{description}")
-                result = self.modem.send_at_command(cmd)
-                self.results.append(result)
-                progress.advance(task)
-                time.sleep(0.2)
+                for cmd in commands:
+                    result = self.vendor_responses.get(cmd) or sent[cmd]
+                    self.results.append(result)
+                    field = _DIAG_FIELD_BY_COMMAND.get(cmd)
+                    if field and result.success and result.parsed_data.get(field):
+                        covered_fields.add(field)
+                progress.advance(task, len(group))
 
         return self.results
 
@@ -717,38 +1308,38 @@ class DiagnosticTests:
 
         console.print()
 
-        # Device Information
-        self._display_device_info()
-        console.print()
-
-        # SIM Information
-        self._display_sim_info()
-        console.print()
-
-        # Network Status
-        self._display_network_status()
-        console.print()
-
-        # Signal Quality
-        self._display_signal_quality()
-        console.print()
-
-        # PDP Context
-        self._display_pdp_context()
+        sections = [
+            self._display_device_info(),
+            self._display_sim_info(),
+            self._display_network_status(),
+            self._display_signal_quality(),
+            self._display_pdp_context(),
+        ]
 
         # Vendor-specific information
         if self.modem_vendor == 'Quectel':
-            console.print()
-            self._display_quectel_advanced()
+            sections.append(self._display_quectel_advanced())
+
+        # Render every section in a single pass, separated by blank lines
+        renderables = []
+        for section in sections:
+            if section is None:
+                continue
+            if renderables:
+                renderables.append(Text(""))
+            renderables.append(section)
+
+        if renderables:
+            console.print(Group(*renderables))
 
     def _display_quectel_advanced(self):
-        """Display Quectel-specific advanced information"""
+        """Build the Quectel-specific advanced information table"""
         # Check if we have Quectel-specific data
         has_qeng = any('servingcell_type' in r.parsed_data for r in self.results)
         has_qnwinfo = any('access_tech' in r.parsed_data and 'band' in r.parsed_data for r in self.results)
 
         if not has_qeng and not has_qnwinfo:
-            return
+            return None
 
         table = Table(title="Advanced Cell Information (Quectel)", box=box.ROUNDED, show_header=True,
                       header_style="bold magenta")
@@ -758,89 +1349,105 @@ class DiagnosticTests:
 
         for result in self.results:
             parsed = result.parsed_data
+            pget = parsed.get
 
             # QENG serving cell data
             if 'servingcell_type' in parsed and parsed['servingcell_type'] == 'servingcell':
-                table.add_row("Cell ID", parsed.get('cellid', ''), f"PCI: {parsed.get('pcid', '')}")
-                table.add_row("Frequency", f"EARFCN: {parsed.get('earfcn', '')}",
-                              f"Band: {parsed.get('freq_band', '')}")
-                table.add_row("Bandwidth", f"DL: {parsed.get('dl_bandwidth', '')} MHz",
-                              f"UL: {parsed.get('ul_bandwidth', '')} MHz")
-                table.add_row("TAC", parsed.get('tac', ''), "")
+                table.add_row("Cell ID", pget('cellid', ''), f"PCI: {pget('pcid', '')}")
+                table.add_row("Frequency", f"EARFCN: {pget('earfcn', '')}",
+                              f"Band: {pget('freq_band', '')}")
+                table.add_row("Bandwidth", f"DL: {pget('dl_bandwidth', '')} MHz",
+                              f"UL: {pget('ul_bandwidth', '')} MHz")
+                table.add_row("TAC", pget('tac', ''), "")
 
                 # LTE signal metrics
                 if 'rsrp' in parsed:
                     rsrp_val = int(parsed['rsrp'].split()[0]) if parsed['rsrp'] else -999
                     rsrp_color = "green" if rsrp_val > -100 else "yellow" if rsrp_val > -110 else "red"
-                    table.add_row("RSRP", f"[{rsrp_color}]{parsed.get('rsrp', '')}[/{rsrp_color}]",
+                    table.add_row("RSRP", f"[{rsrp_color}]{pget('rsrp', '')}[/{rsrp_color}]",
                                   "Reference Signal Received Power")
 
                 if 'rsrq' in parsed:
-                    table.add_row("RSRQ", parsed.get('rsrq', ''), "Reference Signal Received Quality")
+                    table.add_row("RSRQ", pget('rsrq', ''), "Reference Signal Received Quality")
 
                 if 'rssi' in parsed:
-                    table.add_row("RSSI", parsed.get('rssi', ''), "Received Signal Strength Indicator")
+                    table.add_row("RSSI", pget('rssi', ''), "Received Signal Strength Indicator")
 
                 if 'sinr' in parsed:
                     sinr_val = int(parsed['sinr'].split()[0]) if parsed['sinr'] else -999
                     sinr_color = "green" if sinr_val > 13 else "yellow" if sinr_val > 0 else "red"
-                    table.add_row("SINR", f"[{sinr_color}]{parsed.get('sinr', '')}[/{sinr_color}]",
+                    table.add_row("SINR", f"[{sinr_color}]{pget('sinr', '')}[/{sinr_color}]",
                                   "Signal to Interference plus Noise Ratio")
 
             # QNWINFO data
             if 'access_tech' in parsed and 'band' in parsed:
-                table.add_row("Technology", parsed.get('access_tech', ''), f"Band: {parsed.get('band', '')}")
-                table.add_row("Channel", parsed.get('channel', ''), "")
+                table.add_row("Technology", pget('access_tech', ''), f"Band: {pget('band', '')}")
+                table.add_row("Channel", pget('channel', ''), "")
 
             # QSPN data
             if 'spn' in parsed:
-                table.add_row("SPN", parsed.get('spn', ''), f"FNN: {parsed.get('fnn', '')}")
+                table.add_row("SPN", pget('spn', ''), f"FNN: {pget('fnn', '')}")
 
-        if table.row_count > 0:
-            console.print(table)
+        return table if table.row_count > 0 else None
+
+    def _has_results_for(self, keys: frozenset) -> bool:
+        """Check whether any result carries at least one of the given parsed keys"""
+        return any(not keys.isdisjoint(result.parsed_data) for result in self.results)
 
     def _display_device_info(self):
-        """Display device information table"""
+        """Build the device information table"""
+        if not self._has_results_for(_DEVICE_KEYS):
+            return None
+
         table = Table(title="Device Information", box=box.ROUNDED, show_header=True, header_style="bold magenta")
         table.add_column("Property", style="cyan", width=20)
         table.add_column("Value", style="white")
 
         for result in self.results:
-            if 'manufacturer' in result.parsed_data:
-                table.add_row("Manufacturer", result.parsed_data['manufacturer'])
-            if 'model' in result.parsed_data:
-                table.add_row("Model", result.parsed_data['model'])
-            if 'firmware' in result.parsed_data:
-                table.add_row("Firmware", result.parsed_data['firmware'])
-            if 'imei' in result.parsed_data:
-                table.add_row("IMEI", result.parsed_data['imei'])
+            parsed = result.parsed_data
+            if 'manufacturer' in parsed:
+                table.add_row("Manufacturer", parsed['manufacturer'])
+            if 'model' in parsed:
+                table.add_row("Model", parsed['model'])
+            if 'firmware' in parsed:
+                table.add_row("Firmware", parsed['firmware'])
+            if 'imei' in parsed:
+                table.add_row("IMEI", parsed['imei'])
 
-        console.print(table)
+        return table
 
     def _display_sim_info(self):
-        """Display SIM information table"""
+        """Build the SIM information table"""
+        if not self._has_results_for(_SIM_KEYS):
+            return None
+
         table = Table(title="SIM Card Information", box=box.ROUNDED, show_header=True, header_style="bold magenta")
         table.add_column("Property", style="cyan", width=20)
         table.add_column("Value", style="white")
         table.add_column("Status", style="white")
 
         for result in self.results:
-            if 'sim_status' in result.parsed_data:
-                status_color = "green" if result.parsed_data.get('sim_ready', False) else "red"
+            parsed = result.parsed_data
+            pget = parsed.get
+            if 'sim_status' in parsed:
+                status_color = "green" if pget('sim_ready', False) else "red"
                 table.add_row(
                     "SIM Status",
-                    result.parsed_data['sim_status'],
-                    f"[{status_color}]{result.parsed_data.get('sim_status_text', '')}[/{status_color}]"
+                    parsed['sim_status'],
+                    f"[{status_color}]{pget('sim_status_text', '')}[/{status_color}]"
                 )
-            if 'iccid' in result.parsed_data:
-                table.add_row("ICCID", result.parsed_data['iccid'], "")
-            if 'imsi' in result.parsed_data:
-                table.add_row("IMSI", result.parsed_data['imsi'], "")
+            if 'iccid' in parsed:
+                table.add_row("ICCID", parsed['iccid'], "")
+            if 'imsi' in parsed:
+                table.add_row("IMSI", parsed['imsi'], "")
 
-        console.print(table)
+        return table
 
     def _display_network_status(self):
-        """Display network registration status"""
+        """Build the network registration status table"""
+        if not self._has_results_for(_NET_KEYS):
+            return None
+
         table = Table(title="Network Registration Status", box=box.ROUNDED, show_header=True,
                       header_style="bold magenta")
         table.add_column("Type", style="cyan", width=15)
@@ -850,63 +1457,18 @@ class DiagnosticTests:
 
         for result in self.results:
             parsed = result.parsed_data
+            pget = parsed.get
 
-            # CS Registration
-            if 'creg_status' in parsed:
-                status = parsed['creg_status']
-                status_color = "green" if status in [1, 5] else "yellow" if status == 2 else "red"
-                details = []
-                if 'lac' in parsed:
-                    details.append(f"LAC: {parsed['lac']}")
-                if 'ci' in parsed:
-                    details.append(f"CI: {parsed['ci']}")
-                table.add_row(
-                    "CS (Voice)",
-                    str(status),
-                    f"[{status_color}]{parsed.get('creg_status_text', '')}[/{status_color}]",
-                    ", ".join(details)
-                )
-
-            # PS Registration
-            if 'cgreg_status' in parsed:
-                status = parsed['cgreg_status']
-                status_color = "green" if status in [1, 5] else "yellow" if status == 2 else "red"
-                details = []
-                if 'lac' in parsed:
-                    details.append(f"LAC: {parsed['lac']}")
-                if 'ci' in parsed:
-                    details.append(f"CI: {parsed['ci']}")
-                if 'act_text' in parsed:
-                    details.append(f"AcT: {parsed['act_text']}")
-                table.add_row(
-                    "PS (Data)",
-                    str(status),
-                    f"[{status_color}]{parsed.get('cgreg_status_text', '')}[/{status_color}]",
-                    ", ".join(details)
-                )
-
-            # EPS Registration
-            if 'cereg_status' in parsed:
-                status = parsed['cereg_status']
-                status_color = "green" if status in [1, 5] else "yellow" if status == 2 else "red"
-                details = []
-                if 'lac' in parsed:
-                    details.append(f"TAC: {parsed['lac']}")
-                if 'ci' in parsed:
-                    details.append(f"CI: {parsed['ci']}")
-                if 'act_text' in parsed:
-                    details.append(f"AcT: {parsed['act_text']}")
-                table.add_row(
-                    "EPS (LTE)",
-                    str(status),
-                    f"[{status_color}]{parsed.get('cereg_status_text', '')}[/{status_color}]",
-                    ", ".join(details)
-                )
+            # CS/PS/EPS registration
+            for status_key, label, detail_keys in _REG_ROWS:
+                if status_key in parsed:
+                    status_code, status_markup = _fmt_status(parsed[status_key], pget(f'{status_key}_text', ''))
+                    table.add_row(label, status_code, status_markup, _build_details(parsed, detail_keys))
 
             # Operator
             if 'operator' in parsed:
-                mode_text = parsed.get('mode_text', '')
-                act_text = parsed.get('access_tech_text', '')
+                mode_text = pget('mode_text', '')
+                act_text = pget('access_tech_text', '')
                 table.add_row(
                     "Operator",
                     "",
@@ -914,10 +1476,13 @@ class DiagnosticTests:
                     f"{mode_text}, {act_text}" if act_text else mode_text
                 )
 
-        console.print(table)
+        return table
 
     def _display_signal_quality(self):
-        """Display signal quality metrics"""
+        """Build the signal quality metrics table"""
+        if not self._has_results_for(_SIGNAL_KEYS):
+            return None
+
         table = Table(title="Signal Quality", box=box.ROUNDED, show_header=True, header_style="bold magenta")
         table.add_column("Metric", style="cyan", width=20)
         table.add_column("Raw Value", style="white", width=12)
@@ -925,40 +1490,35 @@ class DiagnosticTests:
         table.add_column("Assessment", style="white")
 
         for result in self.results:
-            if 'rssi_raw' in result.parsed_data:
-                parsed = result.parsed_data
+            parsed = result.parsed_data
+            pget = parsed.get
+            if 'rssi_raw' in parsed:
                 rssi_raw = parsed['rssi_raw']
-                quality = parsed.get('signal_quality', 'Unknown')
-
-                # Color code based on quality
-                quality_color = {
-                    'Excellent': 'green',
-                    'Good': 'green',
-                    'Fair': 'yellow',
-                    'Poor': 'red',
-                    'Very Poor': 'red'
-                }.get(quality, 'white')
+                quality = pget('signal_quality', 'Unknown')
 
                 table.add_row(
                     "RSSI",
                     str(rssi_raw),
-                    parsed.get('rssi_dbm', ''),
-                    f"[{quality_color}]{quality}[/{quality_color}]"
+                    pget('rssi_dbm', ''),
+                    # Color code based on quality
+                    _QUALITY_MARKUP.get(quality) or f"[white]{quality}[/white]"
                 )
 
                 table.add_row(
                     "BER",
                     str(parsed['ber_raw']),
-                    parsed.get('ber_text', ''),
+                    pget('ber_text', ''),
                     ""
                 )
 
-        console.print(table)
+        return table
 
     def _display_pdp_context(self):
-        """Display PDP context configuration"""
+        """Build the PDP context configuration tables"""
+        tables = []
         for result in self.results:
-            if 'contexts' in result.parsed_data and result.parsed_data['contexts']:
+            parsed = result.parsed_data
+            if 'contexts' in parsed and parsed['contexts']:
                 table = Table(title="PDP Context Configuration", box=box.ROUNDED, show_header=True,
                               header_style="bold magenta")
                 table.add_column("CID", style="cyan", width=5)
@@ -966,7 +1526,7 @@ class DiagnosticTests:
                 table.add_column("APN", style="white", width=30)
                 table.add_column("Address", style="white")
 
-                for ctx in result.parsed_data['contexts']:
+                for ctx in parsed['contexts']:
                     table.add_row(
                         str(ctx['cid']),
                         ctx['pdp_type'],
@@ -974,7 +1534,9 @@ class DiagnosticTests:
                         ctx['pdp_addr']
                     )
 
-                console.print(table)
+                tables.append(table)
+
+        return Group(*tables) if tables else None
 
 
 class NetworkTools:
@@ -1000,9 +1562,7 @@ class NetworkTools:
             return
 
         # Parse network list
-        networks = []
-        pattern = r'\((\d+),"([^"]*)","([^"]*)","(\d+)",(\d+)\)'
-        matches = re.findall(pattern, result.raw_response)
+        matches = _RE_COPS_SCAN.findall(result.raw_response)
 
         if not matches:
             console.print("[yellow]No networks found or unable to parse results[/yellow]")
@@ -1015,34 +1575,13 @@ class NetworkTools:
         table.add_column("Network Code", style="white", width=15)
         table.add_column("Technology", style="white")
 
-        status_map = {
-            '0': 'Unknown',
-            '1': '[green]Available[/green]',
-            '2': '[blue]Current[/blue]',
-            '3': '[red]Forbidden[/red]'
-        }
-
-        tech_map = {
-            '0': 'GSM',
-            '1': 'GSM Compact',
-            '2': 'UTRAN',
-            '3': 'GSM w/EGPRS',
-            '4': 'UTRAN w/HSDPA',
-            '5': 'UTRAN w/HSUPA',
-            '6': 'UTRAN w/HSUPA+HSDPA',
-            '7': 'E-UTRAN (LTE)',
-            '8': 'EC-GSM-IoT',
-            '9': 'E-UTRAN NB-S1'
-        }
-
-        for match in matches:
-            stat, long_name, short_name, numeric, tech = match
+        for stat, long_name, short_name, numeric, tech in matches:
             table.add_row(
-                status_map.get(stat, stat),
+                _NET_STATUS_MAP.get(stat, stat),
                 long_name,
                 short_name,
                 numeric,
-                tech_map.get(tech, f"Unknown ({tech})")
+                _TECH_MAP.get(tech, f"Unknown ({tech})")
             )
 
         console.print("\n")
@@ -1063,17 +1602,25 @@ class NetworkTools:
             ("AT+CPOL=", "Clear preferred operator list"),
         ]
 
+        # Send both as one ';'-chained line; send_at_chain retries them one at a
+        # time if the modem rejects it, which is safe as both writes are idempotent
+        results = self.modem.send_at_chain([cmd for cmd, _ in commands])
+
         console.print()
-        for cmd, description in commands:
+        for (cmd, description), result in zip(commands, results):
             console.print(f"[cyan]Executing: {description}[/cyan]")
-            result = self.modem.send_at_command(cmd)
 
             if result.success:
                 console.print(f"[green]✓ {description} successful[/green]")
             else:
                 console.print(f"[yellow]⚠ {description} failed (may not be supported)[/yellow]")
 
-            console.print(f"Response: {result.raw_response.strip()}\n")
+            if not result.chained_command:
+                console.print(f"Response: {result.raw_response.strip()}\n")
+
+        # A chained send got one reply for both commands
+        if results[0].chained_command:
+            console.print(f"Response: {results[0].raw_response.strip()}\n")
 
         console.print("[green]FPLMN clear operation completed[/green]")
         console.print("[yellow]Note: You may need to restart the modem for changes to take effect[/yellow]")
@@ -1243,6 +1790,14 @@ class NetworkTools:
             console.print(f"Status: {reg_result.parsed_data['creg_status_text']}")
 
 
+@functools.lru_cache(maxsize=128)
+def _resolve_host(hostname: str) -> str:
+    """Resolve a hostname once per session, preferring IPv4 since cellular data is usually IPv4-only"""
+    addresses = socket.getaddrinfo(hostname, None, type=socket.SOCK_STREAM)
+    ipv4 = [info for info in addresses if info[0] == socket.AF_INET]
+    return (ipv4 or addresses)[0][4][0]
+
+
 class DataTransferTest:
     """Tools for testing cellular data transfer and validating provider billing"""
 
@@ -1252,34 +1807,139 @@ class DataTransferTest:
         self.original_wifi_interface = None
         self.routes_added = []  # Track routes we add for cleanup
         self.services_stopped = []  # Track which services we stopped
+        # (time.monotonic(), result) of the last lookups, see _WIFI_IFACE_TTL
+        self._wifi_iface_cache: Optional[Tuple[float, Optional[str]]] = None
+        self._default_route_cache: Optional[Tuple[float, Optional[Dict[str, str]]]] = None
+        self._wifi_status_cache: Optional[Tuple[float, Dict]] = None
+        self._iface_cache: Optional[Tuple[float, bool, List[Dict[str, str]]]] = None  # (time, diagnostic_mode, result)
+
+    @staticmethod
+    def _ip_json(*args: str) -> Optional[List[Dict]]:
+        """Run `ip -j <args>` and return its decoded JSON output
+
+        Answered over netlink instead when pyroute2 is installed. Returns None if
+        the command fails (e.g. BusyBox ip has no -j), so callers can fall back
+        to parsing the text output.
+        """
+        if HAS_PYROUTE2:
+            records = DataTransferTest._ip_netlink(*args)
+            if records is not None:
+                return records
+
+        try:
+            result = subprocess.run([_IP_BIN, '-j'] + list(args), capture_output=True, text=True, timeout=5)
+            if result.returncode == 0:
+                return json.loads(result.stdout) if result.stdout.strip() else []
+        except (OSError, subprocess.SubprocessError, ValueError):
+            pass
+        return None
+
+    @staticmethod
+    def _ip_netlink(*args: str) -> Optional[List[Dict]]:
+        """Answer the `ip -j` queries used here from netlink, shaped like iproute2's JSON
+
+        Handles `route show default`, `link show [dev]` and `addr show [dev]` (IPv4
+        addresses only). Returns None for anything else or if netlink fails.
+        """
+        try:
+            with IPRoute() as ipr:
+                if args == ('route', 'show', 'default'):
+                    routes = []
+                    for route in ipr.get_default_routes(family=socket.AF_INET):
+                        oif = route.get_attr('RTA_OIF')
+                        links = ipr.get_links(oif) if oif else []
+                        if links:
+                            routes.append({'dst': 'default', 'dev': links[0].get_attr('IFLA_IFNAME')})
+                    return routes
+
+                if args[:2] not in (('link', 'show'), ('addr', 'show')) or len(args) > 3:
+                    return None
+
+                if len(args) == 3:
+                    indexes = ipr.link_lookup(ifname=args[2])
+                    links = ipr.get_links(*indexes) if indexes else []
+                else:
+                    links = ipr.get_links()
+
+                addresses = {}
+                if args[0] == 'addr':
+                    for addr in ipr.get_addr(family=socket.AF_INET):
+                        addresses.setdefault(addr['index'], []).append(
+                            {'family': 'inet', 'local': addr.get_attr('IFA_LOCAL') or addr.get_attr('IFA_ADDRESS')})
+
+                records = []
+                for link in links:
+                    record = {'ifname': link.get_attr('IFLA_IFNAME'), 'operstate': link.get_attr('IFLA_OPERSTATE')}
+                    if args[0] == 'addr':
+                        record['addr_info'] = addresses.get(link['index'], [])
+                    records.append(record)
+                return records
+        except Exception:
+            return None
+
+    @staticmethod
+    def _ip_oneline(*args: str) -> List[List[str]]:
+        """Run `ip -o <args>` and return the whitespace-split fields of each output line"""
+        try:
+            result = subprocess.run([_IP_BIN, '-o'] + list(args), capture_output=True, text=True, timeout=5)
+            if result.returncode == 0:
+                return [line.split() for line in result.stdout.splitlines() if line.strip()]
+        except (OSError, subprocess.SubprocessError):
+            pass
+        return []
+
+    @staticmethod
+    def _field_after(fields: List[str], name: str) -> Optional[str]:
+        """Value following a keyword in `ip -o` output, e.g. 'dev' -> 'wlan0'"""
+        if name in fields[:-1]:
+            return fields[fields.index(name) + 1]
+        return None
+
+    @staticmethod
+    def _route_info(iface: str, ip_addr: Optional[str]) -> Dict[str, str]:
+        """Describe a default route interface"""
+        return {
+            'interface': iface,
+            'ip': ip_addr,
+            'type': 'WiFi' if 'wlan' in iface else 'Ethernet' if 'eth' in iface else 'Cellular' if any(x in iface for x in ['wwan', 'ppp']) else 'Unknown'
+        }
+
+    @staticmethod
+    def _first_ipv4(link: Dict) -> Optional[str]:
+        """First IPv4 address of an `ip -j addr` interface entry"""
+        return next((addr.get('local') for addr in link.get('addr_info', ()) if addr.get('family') == 'inet'), None)
 
     def get_default_route(self) -> Optional[Dict[str, str]]:
-        """Get the current default route interface"""
+        """Get the current default route interface, reusing a lookup from the last few seconds"""
+        now = time.monotonic()
+        if self._default_route_cache and now - self._default_route_cache[0] < _DEFAULT_ROUTE_TTL:
+            return self._default_route_cache[1]
+
+        route = self._find_default_route()
+        self._default_route_cache = (now, route)
+        return route
+
+    def _find_default_route(self) -> Optional[Dict[str, str]]:
+        """Look up the current default route interface"""
         try:
-            if IS_LINUX:
-                result = subprocess.run(['ip', 'route', 'show', 'default'],
-                                      capture_output=True, text=True, timeout=5)
-                if result.returncode == 0 and result.stdout.strip():
-                    # Parse: "default via 192.168.1.1 dev wlan0 proto dhcp metric 600"
-                    match = re.search(r'dev\s+(\S+)', result.stdout)
-                    if match:
-                        iface = match.group(1)
-                        # Get IP for this interface
-                        ip_result = subprocess.run(['ip', 'addr', 'show', iface],
-                                                  capture_output=True, text=True, timeout=5)
-                        ip_addr = None
-                        if ip_result.returncode == 0:
-                            ip_match = re.search(r'inet\s+(\d+\.\d+\.\d+\.\d+)', ip_result.stdout)
-                            if ip_match:
-                                ip_addr = ip_match.group(1)
-
-                        return {
-                            'interface': iface,
-                            'ip': ip_addr,
-                            'type': 'WiFi' if 'wlan' in iface else 'Ethernet' if 'eth' in iface else 'Cellular' if any(x in iface for x in ['wwan', 'ppp']) else 'Unknown'
-                        }
+            routes = self._ip_json('route', 'show', 'default') if IS_LINUX else None
+            if routes is not None:
+                # [{"dst": "default", "gateway": "192.168.1.1", "dev": "wlan0", ...}]
+                iface = next((route['dev'] for route in routes if route.get('dev')), None)
+                if iface:
+                    links = self._ip_json('addr', 'show', iface) or []
+                    return self._route_info(iface, self._first_ipv4(links[0]) if links else None)
+            elif IS_LINUX:
+                # Parse: "default via 192.168.1.1 dev wlan0 proto dhcp metric 600"
+                routes = self._ip_oneline('route', 'show', 'default')
+                iface = self._field_after(routes[0], 'dev') if routes else None
+                if iface:
+                    # Get IP for this interface: "3: wlan0    inet 192.168.1.5/24 brd ..."
+                    addresses = (self._field_after(fields, 'inet') for fields in self._ip_oneline('addr', 'show', iface))
+                    ip_addr = next((address.split('/', 1)[0] for address in addresses if address), None)
+                    return self._route_info(iface, ip_addr)
             elif IS_WINDOWS:
-                result = subprocess.run(['route', 'print', '0.0.0.0'],
+                result = subprocess.run([_ROUTE_BIN, 'print', '0.0.0.0'],
                                       capture_output=True, text=True, timeout=5)
                 if result.returncode == 0:
                     # Parse Windows route output
@@ -1295,17 +1955,28 @@ class DataTransferTest:
         return None
 
     def get_wifi_interface(self) -> Optional[str]:
-        """Detect WiFi interface name"""
+        """Detect WiFi interface name, reusing a lookup from the last few seconds"""
+        now = time.monotonic()
+        if self._wifi_iface_cache and now - self._wifi_iface_cache[0] < _WIFI_IFACE_TTL:
+            return self._wifi_iface_cache[1]
+
+        wifi_iface = self._find_wifi_interface()
+        self._wifi_iface_cache = (now, wifi_iface)
+        return wifi_iface
+
+    def _find_wifi_interface(self) -> Optional[str]:
+        """Look up the WiFi interface name"""
         try:
-            if IS_LINUX:
-                result = subprocess.run(['ip', 'link', 'show'], capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    # Look for wlan interfaces
-                    match = re.search(r'\d+:\s+(wlan\d+):', result.stdout)
-                    if match:
-                        return match.group(1)
+            links = self._ip_json('link', 'show') if IS_LINUX else None
+            if links is not None:
+                return next((link['ifname'] for link in links
+                             if _RE_WLAN_IFACE.fullmatch(link.get('ifname', ''))), None)
+            elif IS_LINUX:
+                # Look for wlan interfaces: "3: wlan0: <BROADCAST,MULTICAST,UP,LOWER_UP> mtu 1500 ..."
+                names = (fields[1].rstrip(':') for fields in self._ip_oneline('link', 'show') if len(fields) > 1)
+                return next((name for name in names if _RE_WLAN_IFACE.fullmatch(name)), None)
             elif IS_WINDOWS:
-                result = subprocess.run(['netsh', 'interface', 'show', 'interface'],
+                result = subprocess.run([_NETSH_BIN, 'interface', 'show', 'interface'],
                                       capture_output=True, text=True, timeout=5)
                 if result.returncode == 0:
                     for line in result.stdout.split('\n'):
@@ -1319,6 +1990,16 @@ class DataTransferTest:
         return None
 
     def check_wifi_status(self) -> Dict[str, any]:
+        """Check if WiFi is active and is the default route, reusing a check from the last few seconds"""
+        now = time.monotonic()
+        if self._wifi_status_cache and now - self._wifi_status_cache[0] < _IFACE_STATUS_TTL:
+            return self._wifi_status_cache[1]
+
+        status = self._find_wifi_status()
+        self._wifi_status_cache = (now, status)
+        return status
+
+    def _find_wifi_status(self) -> Dict[str, any]:
         """Check if WiFi is active and is the default route"""
         status = {
             'wifi_interface': None,
@@ -1328,25 +2009,29 @@ class DataTransferTest:
             'default_route': None
         }
 
-        # Get WiFi interface
-        wifi_iface = self.get_wifi_interface()
-        status['wifi_interface'] = wifi_iface
+        links = self._ip_json('addr', 'show') if IS_LINUX else None
+        if links is not None:
+            # A single `ip -j addr` covers the interface name, link state and addresses
+            wifi = next((link for link in links if _RE_WLAN_IFACE.fullmatch(link.get('ifname', ''))), None)
+            wifi_iface = wifi['ifname'] if wifi else None
+            status['wifi_interface'] = wifi_iface
+            self._wifi_iface_cache = (time.monotonic(), wifi_iface)
+            if wifi:
+                status['wifi_is_up'] = wifi.get('operstate') == 'UP'
+                status['wifi_has_ip'] = self._first_ipv4(wifi) is not None
+        else:
+            # Get WiFi interface
+            wifi_iface = self.get_wifi_interface()
+            status['wifi_interface'] = wifi_iface
 
-        if wifi_iface and IS_LINUX:
-            # Check if WiFi is UP
-            try:
-                result = subprocess.run(['ip', 'link', 'show', wifi_iface],
-                                      capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    status['wifi_is_up'] = 'state UP' in result.stdout
+            if wifi_iface and IS_LINUX:
+                # Check if WiFi is UP: "3: wlan0: <...> mtu 1500 qdisc noqueue state UP mode DORMANT ..."
+                link_rows = self._ip_oneline('link', 'show', wifi_iface)
+                if link_rows:
+                    status['wifi_is_up'] = self._field_after(link_rows[0], 'state') == 'UP'
 
                     # Check if WiFi has IP
-                    ip_result = subprocess.run(['ip', 'addr', 'show', wifi_iface],
-                                              capture_output=True, text=True, timeout=5)
-                    if ip_result.returncode == 0:
-                        status['wifi_has_ip'] = bool(re.search(r'inet\s+\d+', ip_result.stdout))
-            except Exception:
-                pass
+                    status['wifi_has_ip'] = any('inet' in fields for fields in self._ip_oneline('addr', 'show', wifi_iface))
 
         # Check default route
         default_route = self.get_default_route()
@@ -1357,15 +2042,23 @@ class DataTransferTest:
 
         return status
 
+    def _invalidate_iface_cache(self):
+        """Drop cached interface, WiFi and default route state after changing links, addresses or routes"""
+        self._default_route_cache = None
+        self._wifi_status_cache = None
+        self._iface_cache = None
+
     def disable_wifi_temporarily(self) -> bool:
         """Temporarily disable WiFi (requires sudo)"""
         wifi_iface = self.get_wifi_interface()
         if not wifi_iface:
             return False
 
+        self._invalidate_iface_cache()
+
         try:
             if IS_LINUX:
-                result = subprocess.run(['sudo', 'ip', 'link', 'set', wifi_iface, 'down'],
+                result = subprocess.run([_SUDO_BIN, _IP_BIN, 'link', 'set', wifi_iface, 'down'],
                                       capture_output=True, text=True, timeout=10)
                 if result.returncode == 0:
                     self.wifi_was_disabled = True
@@ -1375,7 +2068,7 @@ class DataTransferTest:
                     console.print(f"[red]Failed to disable WiFi: {result.stderr}[/red]")
                     return False
             elif IS_WINDOWS:
-                result = subprocess.run(['netsh', 'interface', 'set', 'interface', wifi_iface, 'disabled'],
+                result = subprocess.run([_NETSH_BIN, 'interface', 'set', 'interface', wifi_iface, 'disabled'],
                                       capture_output=True, text=True, timeout=10)
                 if result.returncode == 0:
                     self.wifi_was_disabled = True
@@ -1392,16 +2085,17 @@ class DataTransferTest:
         if not self.wifi_was_disabled or not self.original_wifi_interface:
             return False
 
+        self._invalidate_iface_cache()
         try:
             if IS_LINUX:
-                result = subprocess.run(['sudo', 'ip', 'link', 'set', self.original_wifi_interface, 'up'],
+                result = subprocess.run([_SUDO_BIN, _IP_BIN, 'link', 'set', self.original_wifi_interface, 'up'],
                                       capture_output=True, text=True, timeout=10)
                 if result.returncode == 0:
                     self.wifi_was_disabled = False
                     console.print(f"[green]✓ WiFi ({self.original_wifi_interface}) re-enabled[/green]")
                     return True
             elif IS_WINDOWS:
-                result = subprocess.run(['netsh', 'interface', 'set', 'interface', self.original_wifi_interface, 'enabled'],
+                result = subprocess.run([_NETSH_BIN, 'interface', 'set', 'interface', self.original_wifi_interface, 'enabled'],
                                       capture_output=True, text=True, timeout=10)
                 if result.returncode == 0:
                     self.wifi_was_disabled = False
@@ -1417,15 +2111,15 @@ class DataTransferTest:
         try:
             if IS_LINUX:
                 # Check if route already exists
-                check_result = subprocess.run(['ip', 'route', 'show', destination],
+                check_result = subprocess.run([_IP_BIN, 'route', 'show', destination],
                                             capture_output=True, text=True, timeout=5)
                 if check_result.returncode == 0 and check_result.stdout.strip():
                     console.print(f"[yellow]Route for {destination} already exists, removing old route first[/yellow]")
-                    subprocess.run(['sudo', 'ip', 'route', 'del', destination],
+                    subprocess.run([_SUDO_BIN, _IP_BIN, 'route', 'del', destination],
                                  capture_output=True, text=True, timeout=5)
 
                 # Add new route
-                result = subprocess.run(['sudo', 'ip', 'route', 'add', destination, 'dev', interface],
+                result = subprocess.run([_SUDO_BIN, _IP_BIN, 'route', 'add', destination, 'dev', interface],
                                       capture_output=True, text=True, timeout=10)
                 if result.returncode == 0:
                     self.routes_added.append({'destination': destination, 'interface': interface})
@@ -1435,7 +2129,7 @@ class DataTransferTest:
                     return False
             elif IS_WINDOWS:
                 # Windows: route add destination mask 255.255.255.255 interface_ip
-                result = subprocess.run(['route', 'add', destination, 'mask', '255.255.255.255', interface],
+                result = subprocess.run([_ROUTE_BIN, 'add', destination, 'mask', '255.255.255.255', interface],
                                       capture_output=True, text=True, timeout=10)
                 if result.returncode == 0:
                     self.routes_added.append({'destination': destination, 'interface': interface})
@@ -1455,7 +2149,7 @@ class DataTransferTest:
         for route in self.routes_added:
             try:
                 if IS_LINUX:
-                    result = subprocess.run(['sudo', 'ip', 'route', 'del', route['destination']],
+                    result = subprocess.run([_SUDO_BIN, _IP_BIN, 'route', 'del', route['destination']],
                                           capture_output=True, text=True, timeout=10)
                     if result.returncode == 0:
                         console.print(f"[green]✓ Removed route for {route['destination']}[/green]")
@@ -1463,7 +2157,7 @@ class DataTransferTest:
                         console.print(f"[yellow]⚠ Could not remove route for {route['destination']}[/yellow]")
                         success = False
                 elif IS_WINDOWS:
-                    result = subprocess.run(['route', 'delete', route['destination']],
+                    result = subprocess.run([_ROUTE_BIN, 'delete', route['destination']],
                                           capture_output=True, text=True, timeout=10)
                     if result.returncode == 0:
                         console.print(f"[green]✓ Removed route for {route['destination']}[/green]")
@@ -1479,9 +2173,7 @@ class DataTransferTest:
     def resolve_hostname(self, hostname: str) -> Optional[str]:
         """Resolve hostname to IP address"""
         try:
-            import socket
-            ip = socket.gethostbyname(hostname)
-            return ip
+            return _resolve_host(hostname)
         except Exception as e:
             console.print(f"[yellow]Could not resolve {hostname}: {e}[/yellow]")
             return None
@@ -1491,22 +2183,18 @@ class DataTransferTest:
         try:
             # Try specific CID first
             result = self.modem.send_at_command(f"AT+CGPADDR={cid}")
-            if result.success and '+CGPADDR:' in result.raw_response:
+            if result.success:
                 # Parse: +CGPADDR: 1,"10.228.100.124"
-                for line in result.raw_response.split('\n'):
-                    if '+CGPADDR:' in line:
-                        match = re.search(r'"([0-9.]+)"', line)
-                        if match:
-                            return match.group(1)
+                match = _RE_CGPADDR_IPV4.search(result.raw_response)
+                if match:
+                    return match.group(1)
 
             # Try without CID (some modems support this)
             result = self.modem.send_at_command("AT+CGPADDR")
-            if result.success and '+CGPADDR:' in result.raw_response:
-                for line in result.raw_response.split('\n'):
-                    if '+CGPADDR:' in line:
-                        match = re.search(r'"([0-9.]+)"', line)
-                        if match:
-                            return match.group(1)
+            if result.success:
+                match = _RE_CGPADDR_IPV4.search(result.raw_response)
+                if match:
+                    return match.group(1)
 
             return None
         except Exception as e:
@@ -1515,11 +2203,12 @@ class DataTransferTest:
 
     def configure_cellular_interface(self, interface_name: str, ip_address: str, netmask: str = "255.255.255.252") -> bool:
         """Bring cellular interface UP and assign IP address"""
+        self._invalidate_iface_cache()
         try:
             if IS_LINUX:
                 # Bring interface UP
                 console.print(f"[cyan]Bringing {interface_name} UP...[/cyan]")
-                result = subprocess.run(['sudo', 'ip', 'link', 'set', interface_name, 'up'],
+                result = subprocess.run([_SUDO_BIN, _IP_BIN, 'link', 'set', interface_name, 'up'],
                                       capture_output=True, text=True, timeout=10)
                 if result.returncode != 0:
                     console.print(f"[red]Failed to bring interface UP: {result.stderr}[/red]")
@@ -1532,11 +2221,11 @@ class DataTransferTest:
                 console.print(f"[cyan]Assigning IP {ip_address} to {interface_name}...[/cyan]")
 
                 # First, flush any existing IP addresses
-                subprocess.run(['sudo', 'ip', 'addr', 'flush', 'dev', interface_name],
+                subprocess.run([_SUDO_BIN, _IP_BIN, 'addr', 'flush', 'dev', interface_name],
                              capture_output=True, text=True, timeout=5)
 
                 # Add the IP address
-                result = subprocess.run(['sudo', 'ip', 'addr', 'add', f'{ip_address}/30', 'dev', interface_name],
+                result = subprocess.run([_SUDO_BIN, _IP_BIN, 'addr', 'add', f'{ip_address}/30', 'dev', interface_name],
                                       capture_output=True, text=True, timeout=10)
                 if result.returncode != 0:
                     console.print(f"[red]Failed to assign IP: {result.stderr}[/red]")
@@ -1553,12 +2242,13 @@ class DataTransferTest:
 
     def add_default_route_cellular(self, interface_name: str) -> bool:
         """Add default route via cellular interface"""
+        self._invalidate_iface_cache()
         try:
             if IS_LINUX:
                 console.print(f"[cyan]Adding default route via {interface_name}...[/cyan]")
 
                 # Add default route
-                result = subprocess.run(['sudo', 'ip', 'route', 'add', 'default', 'dev', interface_name, 'metric', '100'],
+                result = subprocess.run([_SUDO_BIN, _IP_BIN, 'route', 'add', 'default', 'dev', interface_name, 'metric', '100'],
                                       capture_output=True, text=True, timeout=10)
                 if result.returncode != 0:
                     # Route might already exist, that's okay
@@ -1580,6 +2270,10 @@ class DataTransferTest:
             console.print("[yellow]Service management only supported on Linux[/yellow]")
             return False
 
+        if not _SYSTEMCTL_BIN:
+            console.print("[yellow]systemctl not found - cannot manage services[/yellow]")
+            return False
+
         # Check if user is connected via SSH
         ssh_connection = os.environ.get('SSH_CONNECTION') or os.environ.get('SSH_CLIENT')
 
@@ -1607,13 +2301,13 @@ class DataTransferTest:
         for service in services_to_stop:
             try:
                 # Check if service is running
-                check_result = subprocess.run(['systemctl', 'is-active', service],
+                check_result = subprocess.run([_SYSTEMCTL_BIN, 'is-active', service],
                                             capture_output=True, text=True, timeout=5)
 
                 if check_result.stdout.strip() == 'active':
                     # Service is running, stop it
                     console.print(f"[cyan]Stopping {service}...[/cyan]")
-                    result = subprocess.run(['sudo', 'systemctl', 'stop', service],
+                    result = subprocess.run([_SUDO_BIN, _SYSTEMCTL_BIN, 'stop', service],
                                           capture_output=True, text=True, timeout=10)
 
                     if result.returncode == 0:
@@ -1645,7 +2339,7 @@ class DataTransferTest:
         for service in self.services_stopped:
             try:
                 console.print(f"[cyan]Starting {service}...[/cyan]")
-                result = subprocess.run(['sudo', 'systemctl', 'start', service],
+                result = subprocess.run([_SUDO_BIN, _SYSTEMCTL_BIN, 'start', service],
                                       capture_output=True, text=True, timeout=10)
 
                 if result.returncode == 0:
@@ -1733,7 +2427,114 @@ class DataTransferTest:
 
         return verification
 
-    def get_cellular_interfaces(self, diagnostic_mode: bool = False) -> List[Dict[str, str]]:
+    @staticmethod
+    def _cellular_links_netlink() -> Optional[List[Tuple[str, Optional[str], bool, bool, str]]]:
+        """Cellular links as (name, address/prefix, is_up, is_lower_up, summary), from one netlink dump
+
+        Returns None if netlink fails, so the caller can fall back to ip.
+        """
+        try:
+            with IPRoute() as ipr:
+                links = ipr.get_links()
+                addrs = ipr.get_addr(family=socket.AF_INET)
+        except Exception:
+            return None
+
+        # First IPv4 address per interface index, formatted like `ip addr` (10.0.0.2/30)
+        addr_by_index = {}
+        for addr in addrs:
+            address = addr.get_attr('IFA_LOCAL') or addr.get_attr('IFA_ADDRESS')
+            addr_by_index.setdefault(addr['index'], f"{address}/{addr['prefixlen']}")
+
+        found = []
+        for link in links:
+            name = link.get_attr('IFLA_IFNAME')
+            if not name or not _RE_CELL_IFACE_NAME.fullmatch(name):
+                continue
+            operstate = link.get_attr('IFLA_OPERSTATE')
+            found.append((name, addr_by_index.get(link['index']), operstate == 'UP',
+                          bool(link['flags'] & _IFF_LOWER_UP), f"{link['index']}: {name}: state {operstate}"))
+        return found
+
+    @staticmethod
+    def _cellular_links_ip() -> List[Tuple[str, Optional[str], bool, bool, str]]:
+        """Cellular links as (name, address/prefix, is_up, is_lower_up, `ip link` line), from the ip command"""
+        found = []
+
+        # Get all network interfaces
+        result = subprocess.run([_IP_BIN, 'link', 'show'], capture_output=True, text=True, timeout=5)
+        if result.returncode == 0:
+            # Look for common cellular interface names, all patterns in one scan per line
+            for line in result.stdout.split('\n'):
+                match = _RE_IP_LINK_CELL.search(line)
+                if match:
+                    iface_name = match.group(1)
+
+                    # Get detailed interface info
+                    ip_result = subprocess.run([_IP_BIN, 'addr', 'show', iface_name],
+                                              capture_output=True, text=True, timeout=5)
+                    ip_addr = None
+                    if ip_result.returncode == 0:
+                        ip_match = _RE_IP_INET_CIDR.search(ip_result.stdout)
+                        if ip_match:
+                            ip_addr = ip_match.group(1)
+
+                    # Check if interface is UP
+                    is_up = 'UP' in line and 'state UP' in line
+                    is_lower_up = 'LOWER_UP' in line
+
+                    found.append((iface_name, ip_addr, is_up, is_lower_up, line.strip()))
+        return found
+
+    @staticmethod
+    def _cellular_interface_info(iface_name: str, ip_addr: Optional[str], is_up: bool,
+                                 is_lower_up: bool, raw_line: str) -> Dict:
+        """Describe a cellular interface's state and any problems for display"""
+        # Detailed status
+        status_details = []
+        if is_up:
+            status_details.append("UP")
+        else:
+            status_details.append("DOWN")
+
+        if is_lower_up:
+            status_details.append("LOWER_UP")
+
+        # Issues found
+        issues = []
+        if not is_up:
+            issues.append("Interface is DOWN")
+        if not ip_addr:
+            issues.append("No IP address assigned")
+        if is_up and not is_lower_up:
+            issues.append("Physical layer not ready")
+
+        return {
+            'name': iface_name,
+            'ip': ip_addr or 'No IP assigned',
+            'status': 'UP' if is_up else 'DOWN',
+            'is_ready': is_up and ip_addr is not None,
+            'status_details': ', '.join(status_details),
+            'issues': issues,
+            'raw_line': raw_line
+        }
+
+    def get_cellular_interfaces(self, diagnostic_mode: bool = False) -> List[Dict[str, str]]:
+        """Detect available cellular network interfaces, reusing a scan from the last few seconds
+
+        Args:
+            diagnostic_mode: If True, return ALL found interfaces regardless of state
+        """
+        now = time.monotonic()
+        if (self._iface_cache and self._iface_cache[1] == diagnostic_mode
+                and now - self._iface_cache[0] < _IFACE_STATUS_TTL):
+            return self._iface_cache[2]
+
+        interfaces = self._find_cellular_interfaces(diagnostic_mode)
+        self._iface_cache = (now, diagnostic_mode, interfaces)
+        return interfaces
+
+    def _find_cellular_interfaces(self, diagnostic_mode: bool = False) -> List[Dict[str, str]]:
         """Detect available cellular network interfaces
 
         Args:
@@ -1743,63 +2544,14 @@ class DataTransferTest:
 
         try:
             if IS_LINUX:
-                # Get all network interfaces
-                result = subprocess.run(['ip', 'link', 'show'], capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    # Look for common cellular interface patterns
-                    patterns = [r'wwan\d+', r'ppp\d+', r'usb\d+', r'wwp\d+s\d+']
-                    for line in result.stdout.split('\n'):
-                        for pattern in patterns:
-                            match = re.search(r'\d+:\s+(' + pattern + r'):', line)
-                            if match:
-                                iface_name = match.group(1)
-
-                                # Get detailed interface info
-                                ip_result = subprocess.run(['ip', 'addr', 'show', iface_name],
-                                                          capture_output=True, text=True, timeout=5)
-                                ip_addr = None
-                                ip_details = ""
-                                if ip_result.returncode == 0:
-                                    ip_match = re.search(r'inet\s+(\d+\.\d+\.\d+\.\d+(/\d+)?)', ip_result.stdout)
-                                    if ip_match:
-                                        ip_addr = ip_match.group(1)
-                                        ip_details = ip_match.group(0)
-
-                                # Check if interface is UP
-                                is_up = 'UP' in line and 'state UP' in line
-                                is_lower_up = 'LOWER_UP' in line
-
-                                # Detailed status
-                                status_details = []
-                                if is_up:
-                                    status_details.append("UP")
-                                else:
-                                    status_details.append("DOWN")
-
-                                if is_lower_up:
-                                    status_details.append("LOWER_UP")
-
-                                # Issues found
-                                issues = []
-                                if not is_up:
-                                    issues.append("Interface is DOWN")
-                                if not ip_addr:
-                                    issues.append("No IP address assigned")
-                                if is_up and not is_lower_up:
-                                    issues.append("Physical layer not ready")
-
-                                interfaces.append({
-                                    'name': iface_name,
-                                    'ip': ip_addr or 'No IP assigned',
-                                    'status': 'UP' if is_up else 'DOWN',
-                                    'is_ready': is_up and ip_addr is not None,
-                                    'status_details': ', '.join(status_details),
-                                    'issues': issues,
-                                    'raw_line': line.strip()
-                                })
+                # One netlink dump when pyroute2 is installed, otherwise ip link + ip addr per interface
+                links = self._cellular_links_netlink() if HAS_PYROUTE2 else None
+                if links is None:
+                    links = self._cellular_links_ip()
+                interfaces = [self._cellular_interface_info(*link) for link in links]
             elif IS_WINDOWS:
                 # Windows - look for cellular adapters
-                result = subprocess.run(['netsh', 'interface', 'show', 'interface'],
+                result = subprocess.run([_NETSH_BIN, 'interface', 'show', 'interface'],
                                       capture_output=True, text=True, timeout=5)
                 if result.returncode == 0:
                     for line in result.stdout.split('\n'):
@@ -2014,9 +2766,9 @@ class DataUsageTools:
         act_result = self.modem.send_at_command("AT+CGACT?")
         console.print("[cyan]PDP Context Activation Status:[/cyan]")
 
-        for line in act_result.raw_response.split('\n'):
-            if '+CGACT:' in line:
-                match = re.search(r'\+CGACT:\s*(\d+),(\d+)', line)
+        for line in act_result.raw_response.splitlines():
+            if line.lstrip().startswith('+CGACT:'):
+                match = _RE_CGACT.search(line)
                 if match:
                     cid = match.group(1)
                     state = int(match.group(2))
@@ -2029,9 +2781,10 @@ class DataUsageTools:
         addr_result = self.modem.send_at_command("AT+CGPADDR")
         console.print("[cyan]IP Addresses:[/cyan]")
 
-        for line in addr_result.raw_response.split('\n'):
-            if '+CGPADDR:' in line:
-                console.print(f"  {line.strip()}")
+        for line in addr_result.raw_response.splitlines():
+            line = line.strip()
+            if line.startswith('+CGPADDR:'):
+                console.print(f"  {line}")
 
     def check_data_connection(self):
         """Check if data connection is established"""
@@ -2047,12 +2800,13 @@ class DataUsageTools:
         table.add_column("Result", style="white", width=15)
         table.add_column("Details", style="white")
 
-        for cmd, description in tests:
-            result = self.modem.send_at_command(cmd)
+        # Query attach, activation and addresses in a single round trip
+        responses = self.modem.send_at_chain([cmd for cmd, _ in tests] + ["AT+CGPADDR"])
 
+        for (cmd, description), result in zip(tests, responses):
             if result.success:
                 status = "[green]✓ Pass[/green]"
-                details = result.raw_response.strip().replace('\r\n', ' ')
+                details = ' '.join(line.strip() for line in result.reply.splitlines() if line.strip())
             else:
                 status = "[red]✗ Fail[/red]"
                 details = result.error or "No response"
@@ -2064,12 +2818,13 @@ class DataUsageTools:
         ip_details = []
 
         # First try AT+CGPADDR without CID (returns all)
-        result = self.modem.send_at_command("AT+CGPADDR")
+        result = responses[-1]
         if result.success and '+CGPADDR:' in result.raw_response:
             ip_found = True
-            for line in result.raw_response.split('\n'):
-                if '+CGPADDR:' in line:
-                    ip_details.append(line.strip())
+            for line in result.raw_response.splitlines():
+                line = line.strip()
+                if line.startswith('+CGPADDR:'):
+                    ip_details.append(line)
 
         # If that didn't work, try specific CIDs (1-5 are common)
         if not ip_found:
@@ -2077,14 +2832,15 @@ class DataUsageTools:
                 result = self.modem.send_at_command(f"AT+CGPADDR={cid}")
                 if result.success and '+CGPADDR:' in result.raw_response:
                     ip_found = True
-                    for line in result.raw_response.split('\n'):
-                        if '+CGPADDR:' in line:
-                            ip_details.append(line.strip())
+                    for line in result.raw_response.splitlines():
+                        line = line.strip()
+                        if line.startswith('+CGPADDR:'):
+                            ip_details.append(line)
 
         # Add IP address result to table
         if ip_found:
             status = "[green]✓ Pass[/green]"
-            details = ' | '.join(ip_details) if ip_details else result.raw_response.strip().replace('\r\n', ' ')
+            details = ' | '.join(ip_details) if ip_details else ' '.join(line.strip() for line in result.raw_response.splitlines() if line.strip())
         else:
             status = "[red]✗ Fail[/red]"
             details = "No IP address assigned"
@@ -2105,10 +2861,18 @@ class DataUsageTools:
 class ModemDiagnosticTool:
     """Main application class"""
 
+    # Quick probes chain identity queries so one round trip proves a modem is answering.
+    # Echo is left on (no ATE0) since the rest of the session expects it
+    _QUICK_PROBE_COMMAND = "AT+CGMI;+CGMM"
+
     def __init__(self):
         self.modem: Optional[ModemConnection] = None
         self.connected = False
         self.modemmanager_was_stopped = False  # Track if we stopped ModemManager
+        # Connections left open by successful probes, keyed by (port, baudrate)
+        self._probe_cache: Dict[Tuple[str, int], ModemConnection] = {}
+        # Port details from the last detect_serial_ports() call, keyed by path
+        self._port_info: Dict[str, Dict] = {}
 
     def show_banner(self):
         """Display application banner"""
@@ -2149,89 +2913,129 @@ class ModemDiagnosticTool:
                     'type': 'COM Port',
                     'description': port.description or 'No description',
                     'vendor': port.manufacturer or '',
+                    'vid': port.vid,
+                    'pid': port.pid,
                     'priority': 0  # Will be set based on port number
                 }
 
                 # Extract COM port number for prioritization
-                try:
-                    com_num = int(re.search(r'COM(\d+)', port.device).group(1))
-                    port_info['priority'] = -com_num  # Lower COM numbers get higher priority
-                except:
+                com_num = port.device[3:]
+                if port.device.startswith('COM') and com_num.isdigit():
+                    port_info['priority'] = -int(com_num)  # Lower COM numbers get higher priority
+                else:
                     port_info['priority'] = 999
 
                 ports.append(port_info)
 
         else:
             # Linux/Unix serial port detection
-            # Common serial port patterns for cellular modems
-            patterns = [
-                '/dev/ttyUSB*',
-                '/dev/ttyACM*',
-                '/dev/ttyAMA*',
-                '/dev/ttyS*'
-            ]
+            port_paths = list_serial_ports()
 
-            for pattern in patterns:
-                for port_path in glob.glob(pattern):
-                    port_info = {
-                        'path': port_path,
-                        'name': port_path.split('/')[-1],
-                        'type': 'Unknown',
-                        'description': '',
-                        'priority': 0
-                    }
-
-                    # Try to get additional info from udevadm
-                    try:
-                        result = subprocess.run(
-                            ['udevadm', 'info', '--name=' + port_path, '--query=property'],
-                            capture_output=True,
-                            text=True,
-                            timeout=1  # Reduced timeout
-                        )
+            # udev lookups are pure I/O wait, so query every port at once
+            udev_outputs = []
+            if port_paths:
+                with ThreadPoolExecutor(max_workers=min(16, len(port_paths))) as executor:
+                    udev_outputs = list(executor.map(self._query_udev_properties, port_paths))
 
-                        if result.returncode == 0:
-                            for line in result.stdout.split('\n'):
-                                if 'ID_MODEL=' in line:
-                                    port_info['description'] = line.split('=')[1].strip()
-                                elif 'ID_USB_INTERFACE_NUM=' in line:
-                                    interface_num = line.split('=')[1].strip()
-                                    port_info['interface'] = interface_num
-                                elif 'ID_VENDOR=' in line:
-                                    port_info['vendor'] = line.split('=')[1].strip()
-
-                        # Determine port type and priority
-                        if 'ttyUSB' in port_path:
-                            port_info['type'] = 'USB Serial'
-                            # Extract USB number and prioritize HIGHEST first (USB3 > USB2 > USB1 > USB0)
-                            # Modem AT ports are typically on the highest USB interface
-                            match = re.search(r'ttyUSB(\d+)', port_path)
-                            if match:
-                                usb_num = int(match.group(1))
-                                # Negative priority, higher USB number = lower (better) priority value
-                                port_info['priority'] = -usb_num  # USB3=-3, USB2=-2, USB1=-1, USB0=0
-                            else:
-                                port_info['priority'] = 0
-                        elif 'ttyACM' in port_path:
-                            port_info['type'] = 'USB CDC-ACM'
-                            port_info['priority'] = 10
-                        elif 'ttyAMA' in port_path:
-                            port_info['type'] = 'UART (Hardware)'
-                            port_info['priority'] = 20
-                        elif 'ttyS' in port_path:
-                            port_info['type'] = 'Serial Port'
-                            port_info['priority'] = 30
-
-                    except Exception:
-                        pass
-
-                    ports.append(port_info)
+            for port_path, udev_output in zip(port_paths, udev_outputs):
+                port_info = {
+                    'path': port_path,
+                    'name': port_path.split('/')[-1],
+                    'type': 'Unknown',
+                    'description': '',
+                    'priority': 0
+                }
+
+                # Additional info from udev
+                try:
+                    if udev_output:
+                        for line in udev_output.split('\n'):
+                            if 'ID_MODEL=' in line:
+                                port_info['description'] = line.split('=')[1].strip()
+                            elif 'ID_USB_INTERFACE_NUM=' in line:
+                                interface_num = line.split('=')[1].strip()
+                                port_info['interface'] = interface_num
+                            elif 'ID_VENDOR=' in line:
+                                port_info['vendor'] = line.split('=')[1].strip()
+                            elif 'ID_VENDOR_ID=' in line:
+                                port_info['vid'] = int(line.split('=')[1].strip(), 16)
+                            elif 'ID_MODEL_ID=' in line:
+                                port_info['pid'] = int(line.split('=')[1].strip(), 16)
+
+                    # Determine port type and priority
+                    if 'ttyUSB' in port_path:
+                        port_info['type'] = 'USB Serial'
+                        # Extract USB number and prioritize HIGHEST first (USB3 > USB2 > USB1 > USB0)
+                        # Modem AT ports are typically on the highest USB interface
+                        match = _RE_TTYUSB.search(port_path)
+                        if match:
+                            usb_num = int(match.group(1))
+                            # Negative priority, higher USB number = lower (better) priority value
+                            port_info['priority'] = -usb_num  # USB3=-3, USB2=-2, USB1=-1, USB0=0
+                        else:
+                            port_info['priority'] = 0
+                    elif 'ttyACM' in port_path:
+                        port_info['type'] = 'USB CDC-ACM'
+                        port_info['priority'] = 10
+                    elif 'ttyAMA' in port_path:
+                        port_info['type'] = 'UART (Hardware)'
+                        port_info['priority'] = 20
+                    elif 'ttyS' in port_path:
+                        port_info['type'] = 'Serial Port'
+                        port_info['priority'] = 30
+
+                except Exception:
+                    pass
+
+                ports.append(port_info)
+
+        # Remember port identities so a working port can be cached by VID/PID
+        self._port_info = {port_info['path']: port_info for port_info in ports}
 
         # Sort by priority (lower = higher priority)
         return sorted(ports, key=lambda x: (x.get('priority', 999), x['path']))
 
+    @classmethod
+    def _query_udev_properties(cls, port_path: str) -> Optional[str]:
+        """Return udev properties for a port as KEY=value lines, or None if unavailable"""
+        properties = cls._read_udev_database(port_path)
+        if properties is None:
+            properties = cls._run_udevadm_info(port_path)
+        return properties
+
+    @staticmethod
+    def _read_udev_database(port_path: str) -> Optional[str]:
+        """Read a port's properties straight from the udev database, skipping udevadm"""
+        try:
+            rdev = os.stat(port_path).st_rdev
+            db_path = f"/run/udev/data/c{os.major(rdev)}:{os.minor(rdev)}"
+            with open(db_path, 'r', errors='replace') as f:
+                # Property entries are stored as "E:KEY=value"
+                return ''.join(line[2:] for line in f if line.startswith('E:'))
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _run_udevadm_info(port_path: str) -> Optional[str]:
+        """Return udevadm properties output for a port, or None if unavailable"""
+        try:
+            result = subprocess.run(
+                ['udevadm', 'info', '--name=' + port_path, '--query=property'],
+                capture_output=True,
+                text=True,
+                timeout=1  # Reduced timeout
+            )
+            if result.returncode == 0:
+                return result.stdout
+        except Exception:
+            pass
+        return None
+
     def test_port_for_modem(self, port: str, baudrate: int = 115200, quick_test: bool = False) -> Tuple[bool, Optional[str]]:
-        """Test if a port responds to AT commands with timeout protection
+        """Test if a port responds to AT commands
+
+        The probe is bounded by its own serial read/write timeouts, so no watchdog
+        thread is needed and Phase 1 can run several of these concurrently.
 
         Args:
             port: Serial port path
@@ -2241,43 +3045,85 @@ class ModemDiagnosticTool:
         if DEBUG_MODE:
             console.print(f"[dim]DEBUG: Starting test for {port} @ {baudrate}[/dim]")
 
+        error = self._preflight_port(port)
+        if error:
+            return False, error
+
+        success, error, modem = self._probe_port(port, baudrate, quick_test)
+        if DEBUG_MODE:
+            console.print(f"[dim]DEBUG: {port} probe completed, success={success}[/dim]")
+
+        # Keep the verified connection open for connect_modem() to reuse
+        if modem:
+            stale = self._probe_cache.pop((port, baudrate), None)
+            if stale:
+                stale.disconnect()
+            self._probe_cache[(port, baudrate)] = modem
+
+        return success, error
+
+    def test_port_baudrates(self, ports: List[str],
+                            baudrates: List[int]) -> List[Tuple[str, Optional[int], Optional[str]]]:
+        """Test several ports concurrently, each over one serial session retuned through baudrates
+
+        Returns (port, working baud rate or None, error) tuples in the order the ports were given.
+        """
+        results = {}
+        probe_ports = []
+        for port in ports:
+            error = self._preflight_port(port)
+            if error:
+                results[port] = (None, error)
+            else:
+                probe_ports.append(port)
+
+        outcomes = []
+        if probe_ports:
+            with ThreadPoolExecutor(max_workers=min(16, len(probe_ports))) as executor:
+                outcomes = list(executor.map(lambda port: self._probe_port_baudrates(port, baudrates),
+                                             probe_ports))
+
+        for port, (baudrate, modem) in zip(probe_ports, outcomes):
+            if DEBUG_MODE:
+                console.print(f"[dim]DEBUG: {port} baud probe completed, baudrate={baudrate}[/dim]")
+            results[port] = (baudrate, None if baudrate else "No AT response")
+
+            # Keep the verified connection open for connect_modem() to reuse
+            if modem:
+                stale = self._probe_cache.pop((port, baudrate), None)
+                if stale:
+                    stale.disconnect()
+                self._probe_cache[(port, baudrate)] = modem
+
+        return [(port,) + results[port] for port in ports]
+
+    def _preflight_port(self, port: str) -> Optional[str]:
+        """Cheap checks before probing a port; returns an error message or None"""
         # Check blacklist first
         if port in SKIP_PORTS:
             if DEBUG_MODE:
                 console.print(f"[dim]DEBUG: {port} in skip list[/dim]")
-            return False, "Port in skip list (MODEMO_SKIP_PORTS)"
+            return "Port in skip list (MODEMO_SKIP_PORTS)"
 
         # Pre-flight checks on Linux to avoid kernel-level blocking
         if IS_LINUX:
             if DEBUG_MODE:
                 console.print(f"[dim]DEBUG: Running pre-flight checks for {port}[/dim]")
 
-            # Check if port exists and is accessible
-            if not os.path.exists(port):
-                if DEBUG_MODE:
-                    console.print(f"[dim]DEBUG: {port} does not exist[/dim]")
-                return False, "Port does not exist"
-
-            # Check if we have read/write permissions
-            if not os.access(port, os.R_OK | os.W_OK):
-                if DEBUG_MODE:
-                    console.print(f"[dim]DEBUG: {port} permission denied[/dim]")
-                return False, "Permission denied"
-
             # Check if port is already locked/in use by checking for lock file
             # This is a common pattern on Linux
             lock_file = f"/var/lock/LCK..{os.path.basename(port)}"
             if os.path.exists(lock_file):
                 if DEBUG_MODE:
                     console.print(f"[dim]DEBUG: {port} has lock file[/dim]")
-                return False, "Port locked by another process"
+                return "Port locked by another process"
 
             # CRITICAL: Try to open port in non-blocking mode first to detect kernel-level blocks
-            # This is the most aggressive check to prevent hangs
+            # This is the most aggressive check to prevent hangs. It also covers the
+            # existence and permission checks, told apart by errno
             if DEBUG_MODE:
                 console.print(f"[dim]DEBUG: Attempting non-blocking open of {port}[/dim]")
             try:
-                import fcntl
                 # Try to open with O_NONBLOCK to avoid blocking on open()
                 fd = os.open(port, os.O_RDWR | os.O_NOCTTY | os.O_NONBLOCK)
 
@@ -2286,70 +3132,136 @@ class ModemDiagnosticTool:
                 if DEBUG_MODE:
                     console.print(f"[dim]DEBUG: Non-blocking open of {port} SUCCESS[/dim]")
             except OSError as e:
-                # Port is blocked at kernel level or has issues
                 if DEBUG_MODE:
                     console.print(f"[dim]DEBUG: {port} OSError: {e.errno} {e.strerror}[/dim]")
-                return False, f"Port unavailable ({e.errno}: {e.strerror})"
+                if e.errno == errno.ENOENT:
+                    return "Port does not exist"
+                if e.errno in (errno.EACCES, errno.EPERM):
+                    return "Permission denied"
+                # Port is blocked at kernel level or has issues
+                return f"Port unavailable ({e.errno}: {e.strerror})"
             except Exception as e:
                 if DEBUG_MODE:
                     console.print(f"[dim]DEBUG: {port} Exception: {str(e)}[/dim]")
-                return False, f"Port test failed: {str(e)}"
+                return f"Port test failed: {str(e)}"
+
+        return None
 
-        # Use a threading approach with timeout to prevent hangs
-        result_container = {'success': False, 'error': 'Timeout'}
+    @classmethod
+    def _probe_port(cls, port: str, baudrate: int,
+                    quick_test: bool) -> Tuple[bool, Optional[str], Optional[ModemConnection]]:
+        """Open a port and send AT, returning (success, error, open connection on success)"""
+        timeout_val = 0.5 if quick_test else 2
+        test_modem = ModemConnection(port=port, baudrate=baudrate, timeout=timeout_val)
+        try:
+            if quick_test:
+                # The identity query is the whole handshake, no separate AT first. It
+                # returns on OK, so the short deadline only bounds ports that stay silent
+                success = test_modem.probe_identity(cls._QUICK_PROBE_COMMAND, wait_time=0.15)
+            else:
+                if not test_modem.connect():
+                    return False, "Cannot open port", None
 
-        def test_thread():
-            try:
-                timeout_val = 0.5 if quick_test else 2
-                test_modem = ModemConnection(port=port, baudrate=baudrate, timeout=timeout_val)
-
-                # Pass quick_test flag to connect method
-                if test_modem.connect(quick_test=quick_test):
-                    # Try AT command
-                    result = test_modem.send_at_command("AT", wait_time=0.3 if quick_test else 1.0)
-                    test_modem.disconnect()
-
-                    if result.success:
-                        result_container['success'] = True
-                        result_container['error'] = None
-                    else:
-                        result_container['success'] = False
-                        result_container['error'] = "No AT response"
-                else:
-                    result_container['success'] = False
-                    result_container['error'] = "Cannot open port"
-            except Exception as e:
-                result_container['success'] = False
-                result_container['error'] = str(e)
+                # Try AT command
+                result = test_modem.send_at_command("AT", wait_time=1.0)
+                success = result.success
 
-        # Create and start thread
-        if DEBUG_MODE:
-            console.print(f"[dim]DEBUG: Starting thread for {port}[/dim]")
-        thread = threading.Thread(target=test_thread, daemon=True)
-        thread.start()
+            if success:
+                return True, None, test_modem
 
-        # Wait for thread with timeout - VERY aggressive for quick test
-        # If a port doesn't respond in 1 second, it's likely not an AT port
-        thread_timeout = 1.0 if quick_test else 5.0
-        if DEBUG_MODE:
-            console.print(f"[dim]DEBUG: Waiting {thread_timeout}s for thread to complete...[/dim]")
+            test_modem.disconnect()
+            return False, "No AT response", None
+        except Exception as e:
+            test_modem.disconnect()
+            return False, str(e), None
 
-        start_time = time.time()
-        thread.join(timeout=thread_timeout)
-        elapsed = time.time() - start_time
+    @staticmethod
+    def _probe_port_baudrates(port: str,
+                              baudrates: List[int]) -> Tuple[Optional[int], Optional[ModemConnection]]:
+        """Probe one port through several baud rates, returning (working rate, open connection)"""
+        test_modem = ModemConnection(port=port, baudrate=baudrates[0], timeout=2)
+        baudrate = test_modem.probe_baudrates(baudrates)
+        return baudrate, test_modem if baudrate else None
+
+    def _close_probe_cache(self, keep: Optional[Tuple[str, int]] = None) -> Optional[ModemConnection]:
+        """Close connections left open by port probes, returning the one for `keep` still open"""
+        kept = self._probe_cache.pop(keep, None) if keep else None
+        for modem in self._probe_cache.values():
+            modem.disconnect()
+        self._probe_cache.clear()
+        return kept
 
-        if DEBUG_MODE:
-            console.print(f"[dim]DEBUG: Thread join returned after {elapsed:.2f}s[/dim]")
+    @staticmethod
+    def _describe_port(port_info: Dict, default: str = "No description available") -> str:
+        """Vendor and model description of a detected port for display"""
+        desc = f"{port_info.get('vendor', '')} {port_info.get('description', '')}".strip()
+        return desc or default
 
-        # If thread is still alive, it timed out
-        if thread.is_alive():
-            if DEBUG_MODE:
-                console.print(f"[dim]DEBUG: Thread TIMEOUT after {thread_timeout}s[/dim]")
-            return False, f"Timeout ({thread_timeout}s) - port may be unresponsive"
+    def _load_cached_port(self) -> Optional[Dict]:
+        """Load the last working port settings, or None if none are saved"""
+        try:
+            with open(_LAST_PORT_FILE) as f:
+                cached = json.load(f)
+            if cached.get('port') and cached.get('baudrate'):
+                return cached
+        except (OSError, ValueError, AttributeError):
+            pass
+        return None
 
-        if DEBUG_MODE:
-            console.print(f"[dim]DEBUG: Thread completed, success={result_container['success']}[/dim]")
-        return result_container['success'], result_container['error']
+    def _save_cached_port(self, port: str, baudrate: int, rtscts: Optional[bool] = None,
+                          vid: Optional[int] = None, pid: Optional[int] = None,
+                          interface: Optional[str] = None):
+        """Save a working port so the next run can skip auto-detection"""
+        try:
+            os.makedirs(os.path.dirname(_LAST_PORT_FILE), exist_ok=True)
+            with open(_LAST_PORT_FILE, 'w') as f:
+                json.dump({'port': port, 'baudrate': baudrate, 'rtscts': rtscts, 'vid': vid,
+                           'pid': pid, 'interface': interface}, f)
+        except OSError:
+            pass
+
+    def _forget_cached_port(self, port: str):
+        """Remove the saved port after it stops answering, unless another port is saved"""
+        cached = self._load_cached_port()
+        if not cached or cached['port'] != port:
+            return
+        try:
+            os.remove(_LAST_PORT_FILE)
+        except OSError:
+            pass
+
+    def _try_cached_port(self) -> Optional[Tuple[str, int]]:
+        """Verify the last working port with a plain AT at its saved settings"""
+        cached = self._load_cached_port()
+        if not cached:
+            return None
+
+        port, baudrate = cached['port'], cached['baudrate']
+
+        # Port paths can change between boots, so follow the device by VID/PID
+        if cached.get('vid') is not None:
+            identity = (cached.get('vid'), cached.get('pid'), cached.get('interface'))
+            matches = [info['path'] for info in self.detect_serial_ports()
+                       if (info.get('vid'), info.get('pid'), info.get('interface')) == identity]
+            if port not in matches:
+                if len(matches) != 1:
+                    return None
+                port = matches[0]
+
+        console.print(f"\n[cyan]Checking last used port {port} @ {baudrate} baud...[/cyan]")
+        # Not the identity probe: the port may have been found by Phase 2 (plain AT,
+        # RTS/CTS) on a device that does not answer +CGMI
+        test_modem = ModemConnection(port=port, baudrate=baudrate, timeout=2)
+        if self._preflight_port(port) or not test_modem.connect(rtscts=cached.get('rtscts')):
+            console.print("[yellow]⚠ Last used port is not responding, running auto-detection[/yellow]")
+            self._forget_cached_port(cached['port'])
+            return None
+
+        # Keep the verified connection open for connect_modem() to reuse
+        self._probe_cache[(port, baudrate)] = test_modem
+
+        console.print(f"[green]✓ {port} is still responding[/green]")
+        return (port, baudrate)
 
     def auto_detect_modem(self) -> Optional[Tuple[str, int]]:
         """Automatically detect cellular modem port with optimized two-phase testing"""
@@ -2381,8 +3293,20 @@ class ModemDiagnosticTool:
                     console.print("[yellow]⚠ Could not stop ModemManager (may need sudo)[/yellow]")
                     console.print("[dim]  Try running: sudo python3 modemo.py[/dim]\n")
 
+        # Try last run's port before scanning everything
+        cached = self._try_cached_port()
+        if cached:
+            if modemmanager_was_stopped:
+                self.modemmanager_was_stopped = True
+            return cached
+
         ports = self.detect_serial_ports()
 
+        if IS_LINUX and ports and not modemmanager_was_stopped and ModemManagerHelper.is_running():
+            blocked_ports = ModemManagerHelper.get_blocked_ports([port['path'] for port in ports])
+            if blocked_ports:
+                console.print(f"[yellow]⚠ ModemManager has open: {', '.join(blocked_ports)}[/yellow]\n")
+
         if not ports:
             console.print("[red]✗ No serial ports found on this system[/red]")
             if modemmanager_was_stopped:
@@ -2400,17 +3324,11 @@ class ModemDiagnosticTool:
         table.add_column("Description", style="white")
 
         for idx, port in enumerate(ports, 1):
-            desc = port.get('description', '')
-            if port.get('vendor'):
-                desc = f"{port.get('vendor', '')} {desc}".strip()
-            if not desc:
-                desc = "No description available"
-
             table.add_row(
                 str(idx),
                 port['path'],
                 port['type'],
-                desc
+                self._describe_port(port)
             )
 
         console.print(table)
@@ -2418,98 +3336,122 @@ class ModemDiagnosticTool:
 
         # Two-phase baud rate testing
         # Phase 1: Try most common baud rate (115200) on all ports first
-        # Phase 2: Only try other baud rates if Phase 1 finds nothing
-        primary_baudrate = 115200
-        fallback_baudrates = [9600, 460800, 57600, 19200]
+        # Phase 2: Only if Phase 1 finds nothing, plain AT at every rate, the primary
+        # one included since Phase 1 also requires an identity answer
+        primary_baudrate = _BAUD_PROBE_ORDER[0]
+        fallback_baudrates = _BAUD_PROBE_ORDER
 
         working_ports = []
 
+        # Bluetooth links and the like are listed above but never probed
+        probe_ports = [port for port in ports
+                       if not _RE_NON_MODEM_PORT.search(f"{port.get('vendor', '')} {port.get('description', '')}")]
+        priority_ports = [port for port in probe_ports if port.get('vid') in KNOWN_MODEM_VIDS]
+        other_ports = [port for port in probe_ports if port.get('vid') not in KNOWN_MODEM_VIDS]
+
         # Phase 1: Quick scan with most common baud rate
         console.print(f"[cyan]Phase 1: Quick scan @ {primary_baudrate} baud...[/cyan]\n")
 
+        # A single candidate needs no spinner, but goes through the same scan
         with Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
-                console=console
+                console=console,
+                disable=len(probe_ports) == 1
         ) as progress:
-            task = progress.add_task("[cyan]Scanning ports...", total=len(ports))
+            task = progress.add_task("[cyan]Scanning ports...", total=len(probe_ports))
 
-            for idx, port in enumerate(ports):
-                port_path = port['path']
-                progress.update(task, description=f"[cyan]Testing {port_path}... ({idx+1}/{len(ports)})")
+            # Known modem vendors first; the remaining ports only if none of them answer
+            for tier in (priority_ports, other_ports):
+                if working_ports or not tier:
+                    continue
 
-                if DEBUG_MODE:
-                    console.print(f"\n[bold cyan]>>> Testing port {idx+1}/{len(ports)}: {port_path}[/bold cyan]")
-
-                is_working, error = self.test_port_for_modem(port_path, primary_baudrate, quick_test=True)
-
-                if is_working:
-                    working_ports.append({
-                        'port': port_path,
-                        'baudrate': primary_baudrate,
-                        'info': port
-                    })
-                    progress.update(task, description=f"[green]✓ {port_path} @ {primary_baudrate} baud - WORKING!")
-                    if DEBUG_MODE:
-                        console.print(f"[bold green]<<< SUCCESS: {port_path} works![/bold green]\n")
-                    time.sleep(0.3)  # Brief pause to show success message
-
-                    # Early exit: If we found a working port, stop testing to avoid hangs on problematic ports
-                    if DEBUG_MODE:
-                        console.print(f"[bold green]Found working port, stopping scan to avoid testing problematic ports[/bold green]")
-                    break  # Exit the loop, we found what we need
-                elif error and "Timeout" in error:
-                    progress.update(task, description=f"[yellow]⏱ {port_path} - Timeout (skipping)")
-                    if DEBUG_MODE:
-                        console.print(f"[yellow]<<< TIMEOUT: {port_path} - moving to next port[/yellow]\n")
-                    time.sleep(0.2)
-                elif error and "Permission" in error:
-                    progress.update(task, description=f"[red]🔒 {port_path} - {error}")
-                    if DEBUG_MODE:
-                        console.print(f"[red]<<< PERMISSION: {port_path} - {error}[/red]\n")
-                    time.sleep(0.2)
-                else:
-                    if DEBUG_MODE:
-                        console.print(f"[dim]<<< FAILED: {port_path} - {error}[/dim]\n")
+                # Probe all ports concurrently - each probe is bounded by its own timeout,
+                # so a dead port no longer delays the ones queued behind it
+                with ThreadPoolExecutor(max_workers=min(16, len(tier))) as executor:
+                    futures = {}
+                    for idx, port in enumerate(tier):
+                        if DEBUG_MODE:
+                            console.print(f"\n[bold cyan]>>> Testing port {idx+1}/{len(tier)}: {port['path']}[/bold cyan]")
+                        future = executor.submit(self.test_port_for_modem, port['path'], primary_baudrate, True)
+                        futures[future] = port
+
+                    for future in as_completed(futures):
+                        if future.cancelled():
+                            continue
+
+                        port = futures[future]
+                        port_path = port['path']
+                        is_working, error = future.result()
+
+                        if is_working:
+                            working_ports.append({
+                                'port': port_path,
+                                'baudrate': primary_baudrate,
+                                'info': port
+                            })
+                            # Printed above the spinner, so it stays visible without pausing the scan
+                            progress.console.print(f"[green]✓ {port_path} @ {primary_baudrate} baud - WORKING![/green]")
+                            if DEBUG_MODE:
+                                console.print(f"[bold green]<<< SUCCESS: {port_path} works![/bold green]\n")
+
+                            # Early exit: cancel probes that have not started yet
+                            if DEBUG_MODE:
+                                console.print(f"[bold green]Found working port, cancelling remaining probes[/bold green]")
+                            for pending in futures:
+                                pending.cancel()
+                        elif error and "Permission" in error:
+                            progress.console.print(f"[red]🔒 {port_path} - {error}[/red]")
+                            if DEBUG_MODE:
+                                console.print(f"[red]<<< PERMISSION: {port_path} - {error}[/red]\n")
+                        else:
+                            if DEBUG_MODE:
+                                console.print(f"[dim]<<< FAILED: {port_path} - {error}[/dim]\n")
+
+                        progress.advance(task)
 
-                progress.advance(task)
+            # Probes already in flight may also succeed - keep the highest-priority
+            # port, as the sequential scan did
+            if len(working_ports) > 1:
+                port_order = {port['path']: idx for idx, port in enumerate(ports)}
+                working_ports = [min(working_ports, key=lambda p: port_order[p['port']])]
 
         console.print()
 
-        # Phase 2: If nothing found, try other baud rates
+        # Phase 2: If nothing found, retry with a plain AT across all baud rates
         if not working_ports:
             console.print("[yellow]⚠ No modems found with standard baud rate[/yellow]")
-            console.print(f"[cyan]Phase 2: Testing alternate baud rates...[/cyan]\n")
+            console.print(f"[cyan]Phase 2: Testing all baud rates...[/cyan]\n")
 
             with Progress(
                     SpinnerColumn(),
                     TextColumn("[progress.description]{task.description}"),
                     console=console
             ) as progress:
-
-                for port in ports:
-                    port_path = port['path']
-                    task = progress.add_task(f"[cyan]Testing {port_path}...", total=len(fallback_baudrates))
-
-                    for baudrate in fallback_baudrates:
-                        progress.update(task, description=f"[cyan]Testing {port_path} @ {baudrate} baud...")
-
-                        is_working, error = self.test_port_for_modem(port_path, baudrate)
-
-                        if is_working:
+                task = progress.add_task(
+                    f"[cyan]Testing {len(probe_ports)} port(s) @ {', '.join(map(str, fallback_baudrates))} baud...",
+                    total=len(probe_ports))
+
+                # One session per port, retuned through the rates; ports run in parallel
+                probe_results = self.test_port_baudrates([port['path'] for port in probe_ports],
+                                                         list(fallback_baudrates))
+                progress.advance(task, len(probe_ports))
+
+                # A common rate still wins over a rarer one found on another port
+                found_rates = [baudrate for _, baudrate, _ in probe_results if baudrate]
+                if found_rates:
+                    best_rate = min(found_rates, key=fallback_baudrates.index)
+                    for port, (port_path, baudrate, _) in zip(probe_ports, probe_results):
+                        if baudrate == best_rate:
                             working_ports.append({
                                 'port': port_path,
                                 'baudrate': baudrate,
                                 'info': port
                             })
-                            progress.update(task, description=f"[green]✓ {port_path} @ {baudrate} baud - WORKING!")
-                            time.sleep(0.3)
-                            break
-
-                        progress.advance(task)
+                            progress.console.print(f"[green]✓ {port_path} @ {baudrate} baud - WORKING![/green]")
 
-                    if not any(p['port'] == port_path for p in working_ports):
-                        progress.update(task, description=f"[dim]✗ {port_path} - No response")
+                if not working_ports:
+                    progress.update(task, description="[dim]✗ No response at any baud rate")
 
             console.print()
 
@@ -2549,31 +3491,21 @@ class ModemDiagnosticTool:
         table.add_column("Description", style="white")
 
         for idx, port_info in enumerate(working_ports, 1):
-            desc = port_info['info'].get('description', 'No description')
-            if port_info['info'].get('vendor'):
-                desc = f"{port_info['info'].get('vendor', '')} {desc}".strip()
-
             table.add_row(
                 str(idx),
                 port_info['port'],
                 str(port_info['baudrate']),
-                desc
+                self._describe_port(port_info['info'], "No description")
             )
 
         console.print(table)
         console.print()
 
-        # Recommend port based on common patterns
-        recommended = None
-        for idx, port_info in enumerate(working_ports, 1):
-            port_path = port_info['port']
-            # USB2 is often the AT command port for multi-port modems
-            if 'ttyUSB2' in port_path:
-                recommended = idx
-                break
-            # If no USB2, prefer USB1
-            elif 'ttyUSB1' in port_path and recommended is None:
-                recommended = idx
+        # Recommend port based on common patterns: USB2 is often the AT command
+        # port for multi-port modems, and USB1 the next best guess
+        port_paths = [port_info['port'] for port_info in working_ports]
+        recommended = (next((idx for idx, path in enumerate(port_paths, 1) if 'ttyUSB2' in path), None)
+                       or next((idx for idx, path in enumerate(port_paths, 1) if 'ttyUSB1' in path), None))
 
         if recommended:
             console.print(f"[yellow]💡 Recommendation: Port #{recommended} (commonly used for AT commands)[/yellow]\n")
@@ -2635,12 +3567,15 @@ class ModemDiagnosticTool:
             port = Prompt.ask("Enter serial port", default=default_port)
             baudrate = int(Prompt.ask("Enter baud rate", default="115200"))
 
-        # Connect with selected settings
-        self.modem = ModemConnection(port=port, baudrate=baudrate)
+        # Connect with selected settings, reusing the port auto-detection already verified
+        probed_modem = self._close_probe_cache(keep=(port, baudrate))
+        if probed_modem:
+            probed_modem.set_timeout(_DEFAULT_SERIAL_TIMEOUT)
+        self.modem = probed_modem or ModemConnection(port=port, baudrate=baudrate)
 
         console.print(f"\n[cyan]Connecting to {port} at {baudrate} baud...[/cyan]")
 
-        if self.modem.connect():
+        if probed_modem or self.modem.connect():
             # Test connection
             result = self.modem.send_at_command("AT")
             if result.success:
@@ -2651,62 +3586,59 @@ class ModemDiagnosticTool:
                 if info.success and 'info' in info.parsed_data:
                     console.print(f"[dim]Device: {info.parsed_data['info'].split(chr(10))[0]}[/dim]")
 
+                port_info = self._port_info.get(port, {})
+                self._save_cached_port(port, baudrate, self.modem.rtscts, port_info.get('vid'),
+                                       port_info.get('pid'), port_info.get('interface'))
+
                 self.connected = True
                 return True
             else:
                 console.print("[red]✗ Connection established but modem not responding[/red]")
+                self._forget_cached_port(port)
                 self.connected = False
                 return False
         else:
             console.print("[red]✗ Failed to establish connection[/red]")
+            self._forget_cached_port(port)
             self.connected = False
             return False
 
     def main_menu(self):
         """Display and handle main menu"""
+        menu_items = [
+            ("1", "Run Full Diagnostic Test", "Complete system diagnostic", self.run_full_diagnostic),
+            ("2", "Quick Status Check", "View current status", self.quick_status),
+            ("3", "Network Tools", "Scan, register, troubleshoot network", self.network_tools_menu),
+            ("4", "APN & Data Connection", "Configure APN, manage PDP contexts", self.data_tools_menu),
+            ("5", "Advanced Tools", "AT commands and vendor features", self.advanced_tools_menu),
+            ("6", "Change Connection/Port", "Reconnect to different port", self._change_connection),
+            ("7", "Export Diagnostic Report", "Save results to file", self.export_report),
+            ("8", "🆘 Restore Network", "Emergency network restoration", self.restore_network),
+            ("0", "Exit", "Quit application", None),
+        ]
+        handlers = {num: handler for num, _, _, handler in menu_items}
+        choices = list(handlers)
+
         while True:
             console.print("\n")
             console.rule("[bold cyan]Main Menu", style="cyan")
             console.print()
 
-            menu_items = [
-                ("1", "Run Full Diagnostic Test", "Complete system diagnostic"),
-                ("2", "Quick Status Check", "View current status"),
-                ("3", "Network Tools", "Scan, register, troubleshoot network"),
-                ("4", "APN & Data Connection", "Configure APN, manage PDP contexts"),
-                ("5", "Advanced Tools", "AT commands and vendor features"),
-                ("6", "Change Connection/Port", "Reconnect to different port"),
-                ("7", "Export Diagnostic Report", "Save results to file"),
-                ("8", "🆘 Restore Network", "Emergency network restoration"),
-                ("0", "Exit", "Quit application"),
-            ]
-
-            for num, title, desc in menu_items:
+            for num, title, desc, _ in menu_items:
                 console.print(f"  [bold cyan]{num}[/bold cyan]. [white]{title}[/white] - [dim]{desc}[/dim]")
 
             console.print()
-            choice = Prompt.ask("Select option", choices=[item[0] for item in menu_items], default="1")
+            choice = Prompt.ask("Select option", choices=choices, default="1")
 
             if choice == "0":
                 break
-            elif choice == "1":
-                self.run_full_diagnostic()
-            elif choice == "2":
-                self.quick_status()
-            elif choice == "3":
-                self.network_tools_menu()
-            elif choice == "4":
-                self.data_tools_menu()
-            elif choice == "5":
-                self.advanced_tools_menu()
-            elif choice == "6":
-                if self.modem:
-                    self.modem.disconnect()
-                self.connect_modem()
-            elif choice == "7":
-                self.export_report()
-            elif choice == "8":
-                self.restore_network()
+            handlers[choice]()
+
+    def _change_connection(self):
+        """Drop the current connection and run connection setup again"""
+        if self.modem:
+            self.modem.disconnect()
+        self.connect_modem()
 
     def run_full_diagnostic(self):
         """Run complete diagnostic test suite"""
@@ -2730,28 +3662,27 @@ class ModemDiagnosticTool:
         console.print("\n")
         console.rule("[bold cyan]Quick Status Check", style="cyan")
 
+        # All four queries in one chained round trip
+        csq, creg, cops, cpin = self.modem.send_at_chain(["AT+CSQ", "AT+CREG?", "AT+COPS?", "AT+CPIN?"])
+
         # Signal quality
-        csq = self.modem.send_at_command("AT+CSQ")
         if 'signal_quality' in csq.parsed_data:
             quality = csq.parsed_data['signal_quality']
-            color = "green" if quality in ['Excellent', 'Good'] else "yellow" if quality == 'Fair' else "red"
+            color = _QUALITY_COLOR.get(quality, 'red')
             console.print(
                 f"\n[bold]Signal Quality:[/bold] [{color}]{quality}[/{color}] ({csq.parsed_data.get('rssi_dbm', 'Unknown')})")
 
         # Registration
-        creg = self.modem.send_at_command("AT+CREG?")
         if 'creg_status_text' in creg.parsed_data:
             status = creg.parsed_data['creg_status']
-            color = "green" if status in [1, 5] else "red"
+            color = "green" if status in _REG_STATUS_SET else "red"
             console.print(f"[bold]Network Status:[/bold] [{color}]{creg.parsed_data['creg_status_text']}[/{color}]")
 
         # Operator
-        cops = self.modem.send_at_command("AT+COPS?")
         if 'operator' in cops.parsed_data:
             console.print(f"[bold]Operator:[/bold] {cops.parsed_data['operator']}")
 
         # SIM status
-        cpin = self.modem.send_at_command("AT+CPIN?")
         if 'sim_status' in cpin.parsed_data:
             color = "green" if cpin.parsed_data.get('sim_ready', False) else "red"
             console.print(f"[bold]SIM Status:[/bold] [{color}]{cpin.parsed_data['sim_status']}[/{color}]")
@@ -2768,38 +3699,34 @@ class ModemDiagnosticTool:
 
         tools = NetworkTools(self.modem)
 
+        # (option, label, action, seconds to show the result before returning)
+        menu_items = [
+            ("1", "Scan Available Networks", tools.scan_networks, 5),
+            ("2", "Force Network Registration", tools.force_network_registration, 3),
+            ("3", "View Forbidden Network List (FPLMN)", tools.view_fplmn, 3),
+            ("4", "Clear Forbidden Network List (FPLMN)", tools.clear_fplmn, 3),
+            ("0", "Back to Main Menu", None, 0),
+        ]
+        handlers = {num: (action, pause) for num, _, action, pause in menu_items}
+        choices = list(handlers)
+
         while True:
             console.print("\n")
             console.rule("[bold cyan]Network Tools", style="cyan")
             console.print()
 
-            console.print("  [bold cyan]1[/bold cyan]. Scan Available Networks")
-            console.print("  [bold cyan]2[/bold cyan]. Force Network Registration")
-            console.print("  [bold cyan]3[/bold cyan]. View Forbidden Network List (FPLMN)")
-            console.print("  [bold cyan]4[/bold cyan]. Clear Forbidden Network List (FPLMN)")
-            console.print("  [bold cyan]0[/bold cyan]. Back to Main Menu")
+            for num, title, _, _ in menu_items:
+                console.print(f"  [bold cyan]{num}[/bold cyan]. {title}")
             console.print()
 
-            choice = Prompt.ask("Select option", choices=["0", "1", "2", "3", "4"], default="1")
+            choice = Prompt.ask("Select option", choices=choices, default="1")
 
             if choice == "0":
                 break
-            elif choice == "1":
-                tools.scan_networks()
-                console.print()
-                auto_continue(5, "Returning to menu")
-            elif choice == "2":
-                tools.force_network_registration()
-                console.print()
-                auto_continue(3, "Returning to menu")
-            elif choice == "3":
-                tools.view_fplmn()
-                console.print()
-                auto_continue(3, "Returning to menu")
-            elif choice == "4":
-                tools.clear_fplmn()
-                console.print()
-                auto_continue(3, "Returning to menu")
+            action, pause = handlers[choice]
+            action()
+            console.print()
+            auto_continue(pause, "Returning to menu")
 
     def data_tools_menu(self):
         """APN & Data connection tools submenu"""
@@ -2811,204 +3738,196 @@ class ModemDiagnosticTool:
         tools = DataUsageTools(self.modem)
         network_tools = NetworkTools(self.modem)
 
+        # (option, label, action, seconds to show the result before returning)
+        menu_items = [
+            ("1", "Configure APN", network_tools.configure_apn, 3),
+            ("2", "Check PDP Context Status", tools.check_pdp_status, 3),
+            ("3", "Check Data Connection", tools.check_data_connection, 3),
+            ("4", "Activate PDP Context", self._activate_pdp_context, 3),
+            ("5", "Deactivate PDP Context", self._deactivate_pdp_context, 3),
+            ("6", "Delete PDP Context", self._delete_pdp_context, 3),
+            ("7", "Test Data Transfer", self.data_transfer_test_menu, 0),
+            ("0", "Back to Main Menu", None, 0),
+        ]
+        handlers = {num: (action, pause) for num, _, action, pause in menu_items}
+        choices = list(handlers)
+
         while True:
             console.print("\n")
             console.rule("[bold cyan]APN & Data Connection", style="cyan")
             console.print()
 
-            console.print("  [bold cyan]1[/bold cyan]. Configure APN")
-            console.print("  [bold cyan]2[/bold cyan]. Check PDP Context Status")
-            console.print("  [bold cyan]3[/bold cyan]. Check Data Connection")
-            console.print("  [bold cyan]4[/bold cyan]. Activate PDP Context")
-            console.print("  [bold cyan]5[/bold cyan]. Deactivate PDP Context")
-            console.print("  [bold cyan]6[/bold cyan]. Delete PDP Context")
-            console.print("  [bold cyan]7[/bold cyan]. Test Data Transfer")
-            console.print("  [bold cyan]0[/bold cyan]. Back to Main Menu")
+            for num, title, _, _ in menu_items:
+                console.print(f"  [bold cyan]{num}[/bold cyan]. {title}")
             console.print()
 
-            choice = Prompt.ask("Select option", choices=["0", "1", "2", "3", "4", "5", "6", "7"], default="1")
+            choice = Prompt.ask("Select option", choices=choices, default="1")
 
             if choice == "0":
                 break
-            elif choice == "1":
-                network_tools.configure_apn()
-                console.print()
-                auto_continue(3, "Returning to menu")
-            elif choice == "2":
-                tools.check_pdp_status()
-                console.print()
-                auto_continue(3, "Returning to menu")
-            elif choice == "3":
-                tools.check_data_connection()
+            action, pause = handlers[choice]
+            action()
+            if pause:
                 console.print()
-                auto_continue(3, "Returning to menu")
-            elif choice == "4":
-                # Show current PDP contexts and their activation status first
-                console.print("\n[bold cyan]📋 Available PDP Contexts:[/bold cyan]\n")
-
-                # Get configured contexts
-                context_result = self.modem.send_at_command("AT+CGDCONT?")
-                # Get activation status
-                act_result = self.modem.send_at_command("AT+CGACT?")
-
-                # Parse activation status
-                active_cids = set()
-                if act_result.success and act_result.raw_response:
-                    for line in act_result.raw_response.split('\n'):
-                        if '+CGACT:' in line:
-                            parts = line.replace('+CGACT:', '').strip().split(',')
-                            if len(parts) >= 2 and parts[1].strip() == '1':
-                                active_cids.add(int(parts[0].strip()))
-
-                if 'contexts' in context_result.parsed_data and context_result.parsed_data['contexts']:
-                    table = Table(box=box.ROUNDED, show_header=True, header_style="bold magenta")
-                    table.add_column("CID", style="cyan", width=8)
-                    table.add_column("APN", style="white", width=30)
-                    table.add_column("Status", style="white", width=15)
+                auto_continue(pause, "Returning to menu")
 
-                    for ctx in context_result.parsed_data['contexts']:
-                        cid = ctx['cid']
-                        status = "[green]Active[/green]" if cid in active_cids else "[yellow]Inactive[/yellow]"
-                        table.add_row(str(cid), ctx['apn'], status)
+    def _activate_pdp_context(self):
+        """Pick an inactive PDP context and activate it"""
+        # Show current PDP contexts and their activation status first
+        console.print("\n[bold cyan]📋 Available PDP Contexts:[/bold cyan]\n")
 
-                    console.print(table)
-                    console.print()
+        # Get configured contexts
+        context_result = self.modem.send_at_command("AT+CGDCONT?")
+        # Get activation status
+        act_result = self.modem.send_at_command("AT+CGACT?")
 
-                    # Only show inactive contexts as options
-                    inactive_cids = [str(ctx['cid']) for ctx in context_result.parsed_data['contexts'] if ctx['cid'] not in active_cids]
+        # Parse activation status
+        active_cids = set()
+        if act_result.success and act_result.raw_response:
+            for line in act_result.raw_response.split('\n'):
+                line = line.strip()
+                if line.startswith('+CGACT:'):
+                    parts = line[len('+CGACT:'):].strip().split(',')
+                    if len(parts) >= 2 and parts[1].strip() == '1':
+                        active_cids.add(int(parts[0].strip()))
+
+        if 'contexts' in context_result.parsed_data and context_result.parsed_data['contexts']:
+            table = Table(box=box.ROUNDED, show_header=True, header_style="bold magenta")
+            table.add_column("CID", style="cyan", width=8)
+            table.add_column("APN", style="white", width=30)
+            table.add_column("Status", style="white", width=15)
 
-                    if not inactive_cids:
-                        console.print("[yellow]All configured PDP contexts are already active![/yellow]")
-                        console.print()
-                        auto_continue(3, "Returning to menu")
-                        continue
+            for ctx in context_result.parsed_data['contexts']:
+                cid = ctx['cid']
+                status = "[green]Active[/green]" if cid in active_cids else "[yellow]Inactive[/yellow]"
+                table.add_row(str(cid), ctx['apn'], status)
 
-                    console.print(f"[dim]Available CIDs to activate: {', '.join(inactive_cids)}[/dim]")
-                    cid = Prompt.ask("Enter CID to activate", choices=inactive_cids, default=inactive_cids[0] if inactive_cids else "1")
-                else:
-                    console.print("[yellow]No PDP contexts configured. Use option 1 to configure APN first.[/yellow]")
-                    console.print()
-                    auto_continue(3, "Returning to menu")
-                    continue
+            console.print(table)
+            console.print()
 
-                result = self.modem.send_at_command(f"AT+CGACT=1,{cid}")
-                if result.success:
-                    console.print(f"[green]✓ PDP context {cid} activated[/green]")
-                    console.print("[dim]Waiting for IP assignment...[/dim]")
-                    time.sleep(3)
+            # Only show inactive contexts as options
+            inactive_cids = [str(ctx['cid']) for ctx in context_result.parsed_data['contexts'] if ctx['cid'] not in active_cids]
 
-                    # Check for IP address
-                    ip_result = self.modem.send_at_command(f"AT+CGPADDR={cid}")
-                    if ip_result.success:
-                        console.print(f"[cyan]IP Address result:[/cyan] {ip_result.response}")
-                else:
-                    console.print(f"[red]✗ Activation failed: {result.error}[/red]")
-                console.print()
-                auto_continue(3, "Returning to menu")
-            elif choice == "5":
-                # Show current PDP contexts and their activation status first
-                console.print("\n[bold cyan]📋 Active PDP Contexts:[/bold cyan]\n")
-
-                # Get configured contexts
-                context_result = self.modem.send_at_command("AT+CGDCONT?")
-                # Get activation status
-                act_result = self.modem.send_at_command("AT+CGACT?")
-
-                # Parse activation status
-                active_cids = set()
-                if act_result.success and act_result.raw_response:
-                    for line in act_result.raw_response.split('\n'):
-                        if '+CGACT:' in line:
-                            parts = line.replace('+CGACT:', '').strip().split(',')
-                            if len(parts) >= 2 and parts[1].strip() == '1':
-                                active_cids.add(int(parts[0].strip()))
-
-                if 'contexts' in context_result.parsed_data and context_result.parsed_data['contexts']:
-                    table = Table(box=box.ROUNDED, show_header=True, header_style="bold magenta")
-                    table.add_column("CID", style="cyan", width=8)
-                    table.add_column("APN", style="white", width=30)
-                    table.add_column("Status", style="white", width=15)
+            if not inactive_cids:
+                console.print("[yellow]All configured PDP contexts are already active![/yellow]")
+                return
 
-                    for ctx in context_result.parsed_data['contexts']:
-                        cid = ctx['cid']
-                        status = "[green]Active[/green]" if cid in active_cids else "[yellow]Inactive[/yellow]"
-                        table.add_row(str(cid), ctx['apn'], status)
+            console.print(f"[dim]Available CIDs to activate: {', '.join(inactive_cids)}[/dim]")
+            cid = Prompt.ask("Enter CID to activate", choices=inactive_cids, default=inactive_cids[0] if inactive_cids else "1")
+        else:
+            console.print("[yellow]No PDP contexts configured. Use option 1 to configure APN first.[/yellow]")
+            return
 
-                    console.print(table)
-                    console.print()
+        result = self.modem.send_at_command(f"AT+CGACT=1,{cid}")
+        if result.success:
+            console.print(f"[green]✓ PDP context {cid} activated[/green]")
+            console.print("[dim]Waiting for IP assignment...[/dim]")
+            time.sleep(3)
+
+            # Check for IP address
+            ip_result = self.modem.send_at_command(f"AT+CGPADDR={cid}")
+            if ip_result.success:
+                console.print(f"[cyan]IP Address result:[/cyan] {ip_result.response}")
+        else:
+            console.print(f"[red]✗ Activation failed: {result.error}[/red]")
 
-                    # Only show active contexts as options
-                    active_cid_strs = [str(cid) for cid in active_cids]
+    def _deactivate_pdp_context(self):
+        """Pick an active PDP context and deactivate it"""
+        # Show current PDP contexts and their activation status first
+        console.print("\n[bold cyan]📋 Active PDP Contexts:[/bold cyan]\n")
 
-                    if not active_cid_strs:
-                        console.print("[yellow]No active PDP contexts to deactivate![/yellow]")
-                        console.print()
-                        auto_continue(3, "Returning to menu")
-                        continue
+        # Get configured contexts
+        context_result = self.modem.send_at_command("AT+CGDCONT?")
+        # Get activation status
+        act_result = self.modem.send_at_command("AT+CGACT?")
 
-                    console.print(f"[dim]Active CIDs: {', '.join(active_cid_strs)}[/dim]")
-                    cid = Prompt.ask("Enter CID to deactivate", choices=active_cid_strs, default=active_cid_strs[0] if active_cid_strs else "1")
-                else:
-                    console.print("[yellow]No PDP contexts configured.[/yellow]")
-                    console.print()
-                    auto_continue(3, "Returning to menu")
-                    continue
+        # Parse activation status
+        active_cids = set()
+        if act_result.success and act_result.raw_response:
+            for line in act_result.raw_response.split('\n'):
+                line = line.strip()
+                if line.startswith('+CGACT:'):
+                    parts = line[len('+CGACT:'):].strip().split(',')
+                    if len(parts) >= 2 and parts[1].strip() == '1':
+                        active_cids.add(int(parts[0].strip()))
+
+        if 'contexts' in context_result.parsed_data and context_result.parsed_data['contexts']:
+            table = Table(box=box.ROUNDED, show_header=True, header_style="bold magenta")
+            table.add_column("CID", style="cyan", width=8)
+            table.add_column("APN", style="white", width=30)
+            table.add_column("Status", style="white", width=15)
 
-                result = self.modem.send_at_command(f"AT+CGACT=0,{cid}")
-                if result.success:
-                    console.print(f"[green]✓ PDP context {cid} deactivated[/green]")
-                else:
-                    console.print(f"[red]✗ Deactivation failed: {result.error}[/red]")
-                console.print()
-                auto_continue(3, "Returning to menu")
-            elif choice == "6":
-                # Show current contexts first
-                console.print("\n[bold cyan]Current PDP Contexts:[/bold cyan]\n")
-                result = self.modem.send_at_command("AT+CGDCONT?")
+            for ctx in context_result.parsed_data['contexts']:
+                cid = ctx['cid']
+                status = "[green]Active[/green]" if cid in active_cids else "[yellow]Inactive[/yellow]"
+                table.add_row(str(cid), ctx['apn'], status)
 
-                if 'contexts' in result.parsed_data and result.parsed_data['contexts']:
-                    table = Table(box=box.ROUNDED, show_header=True, header_style="bold magenta")
-                    table.add_column("CID", style="cyan", width=8)
-                    table.add_column("PDP Type", style="white", width=12)
-                    table.add_column("APN", style="white")
+            console.print(table)
+            console.print()
 
-                    for ctx in result.parsed_data['contexts']:
-                        table.add_row(str(ctx['cid']), ctx['pdp_type'], ctx['apn'])
+            # Only show active contexts as options
+            active_cid_strs = [str(cid) for cid in active_cids]
 
-                    console.print(table)
-                    console.print()
+            if not active_cid_strs:
+                console.print("[yellow]No active PDP contexts to deactivate![/yellow]")
+                return
 
-                    cid = Prompt.ask("Enter CID to delete (or 'cancel' to abort)")
-
-                    if cid.lower() != 'cancel':
-                        # Confirm deletion
-                        if Confirm.ask(f"[yellow]⚠ Are you sure you want to delete PDP context {cid}?[/yellow]", default=False):
-                            # Delete by setting to empty
-                            delete_result = self.modem.send_at_command(f"AT+CGDCONT={cid}")
-                            if delete_result.success:
-                                console.print(f"[green]✓ PDP context {cid} deleted successfully[/green]")
-
-                                # Verify deletion
-                                verify_result = self.modem.send_at_command("AT+CGDCONT?")
-                                if 'contexts' in verify_result.parsed_data:
-                                    remaining = [ctx for ctx in verify_result.parsed_data['contexts'] if str(ctx['cid']) != cid]
-                                    if remaining:
-                                        console.print("\n[cyan]Remaining PDP Contexts:[/cyan]")
-                                        for ctx in remaining:
-                                            console.print(f"  CID {ctx['cid']}: {ctx['pdp_type']}, APN: {ctx['apn']}")
-                                    else:
-                                        console.print("\n[yellow]No PDP contexts remain[/yellow]")
+            console.print(f"[dim]Active CIDs: {', '.join(active_cid_strs)}[/dim]")
+            cid = Prompt.ask("Enter CID to deactivate", choices=active_cid_strs, default=active_cid_strs[0] if active_cid_strs else "1")
+        else:
+            console.print("[yellow]No PDP contexts configured.[/yellow]")
+            return
+
+        result = self.modem.send_at_command(f"AT+CGACT=0,{cid}")
+        if result.success:
+            console.print(f"[green]✓ PDP context {cid} deactivated[/green]")
+        else:
+            console.print(f"[red]✗ Deactivation failed: {result.error}[/red]")
+
+    def _delete_pdp_context(self):
+        """Pick a PDP context and delete it"""
+        # Show current contexts first
+        console.print("\n[bold cyan]Current PDP Contexts:[/bold cyan]\n")
+        result = self.modem.send_at_command("AT+CGDCONT?")
+
+        if 'contexts' in result.parsed_data and result.parsed_data['contexts']:
+            table = Table(box=box.ROUNDED, show_header=True, header_style="bold magenta")
+            table.add_column("CID", style="cyan", width=8)
+            table.add_column("PDP Type", style="white", width=12)
+            table.add_column("APN", style="white")
+
+            for ctx in result.parsed_data['contexts']:
+                table.add_row(str(ctx['cid']), ctx['pdp_type'], ctx['apn'])
+
+            console.print(table)
+            console.print()
+
+            cid = Prompt.ask("Enter CID to delete (or 'cancel' to abort)")
+
+            if cid.lower() != 'cancel':
+                # Confirm deletion
+                if Confirm.ask(f"[yellow]⚠ Are you sure you want to delete PDP context {cid}?[/yellow]", default=False):
+                    # Delete by setting to empty
+                    delete_result = self.modem.send_at_command(f"AT+CGDCONT={cid}")
+                    if delete_result.success:
+                        console.print(f"[green]✓ PDP context {cid} deleted successfully[/green]")
+
+                        # Verify deletion
+                        verify_result = self.modem.send_at_command("AT+CGDCONT?")
+                        if 'contexts' in verify_result.parsed_data:
+                            remaining = [ctx for ctx in verify_result.parsed_data['contexts'] if str(ctx['cid']) != cid]
+                            if remaining:
+                                console.print("\n[cyan]Remaining PDP Contexts:[/cyan]")
+                                for ctx in remaining:
+                                    console.print(f"  CID {ctx['cid']}: {ctx['pdp_type']}, APN: {ctx['apn']}")
                             else:
-                                console.print(f"[red]✗ Deletion failed: {delete_result.error}[/red]")
-                        else:
-                            console.print("[yellow]Deletion cancelled[/yellow]")
+                                console.print("\n[yellow]No PDP contexts remain[/yellow]")
+                    else:
+                        console.print(f"[red]✗ Deletion failed: {delete_result.error}[/red]")
                 else:
-                    console.print("[yellow]No PDP contexts found[/yellow]")
-
-                console.print()
-                auto_continue(3, "Returning to menu")
-            elif choice == "7":
-                self.data_transfer_test_menu()
+                    console.print("[yellow]Deletion cancelled[/yellow]")
+        else:
+            console.print("[yellow]No PDP contexts found[/yellow]")
 
     def data_transfer_test_menu(self):
         """Test cellular data transfer and validate provider billing"""
@@ -3233,7 +4152,7 @@ class ModemDiagnosticTool:
                                         time.sleep(2)  # Wait for interface to stabilize
                                         console.print("[cyan]Verifying interface status...[/cyan]")
 
-                                        verify_result = subprocess.run(['ip', 'addr', 'show', interface_name],
+                                        verify_result = subprocess.run([_IP_BIN, 'addr', 'show', interface_name],
                                                                      capture_output=True, text=True, timeout=5)
 
                                         interface_still_up = 'UP' in verify_result.stdout and 'state UP' in verify_result.stdout
@@ -3254,7 +4173,7 @@ class ModemDiagnosticTool:
 
                                                         # Verify again
                                                         time.sleep(2)
-                                                        verify_result = subprocess.run(['ip', 'addr', 'show', interface_name],
+                                                        verify_result = subprocess.run([_IP_BIN, 'addr', 'show', interface_name],
                                                                                      capture_output=True, text=True, timeout=5)
                                                         interface_still_up = 'UP' in verify_result.stdout and 'state UP' in verify_result.stdout
                                                         has_ip = modem_ip in verify_result.stdout
@@ -3302,7 +4221,7 @@ class ModemDiagnosticTool:
 
                                             # Verify routing
                                             time.sleep(1)
-                                            route_result = subprocess.run(['ip', 'route', 'show', 'default'],
+                                            route_result = subprocess.run([_IP_BIN, 'route', 'show', 'default'],
                                                                         capture_output=True, text=True, timeout=5)
                                             if interface_name in route_result.stdout:
                                                 console.print(f"[green]✓ Default route confirmed via {interface_name}[/green]")
@@ -3770,6 +4689,22 @@ class ModemDiagnosticTool:
 
     def quectel_tools_menu(self, model: str = None):
         """Quectel-specific tools"""
+        # (option, label, AT command, result title, wait time, seconds to show the result)
+        menu_items = [
+            ("1", "View Advanced Cell Information (AT+QENG)", "AT+QENG=\"servingcell\"",
+             "Advanced Cell Information", 1.0, 3),
+            ("2", "View Network Info (AT+QNWINFO)", "AT+QNWINFO", "Network Information", 1.0, 3),
+            ("3", "Check Temperature (AT+QTEMP)", "AT+QTEMP", "Temperature Reading", 1.0, 3),
+            ("4", "View Neighboring Cells (AT+QENG=\"neighbourcell\")", "AT+QENG=\"neighbourcell\"",
+             "Neighboring Cells", 10, 5),
+            ("5", "Query SIM Slot (AT+QUIMSLOT?)", "AT+QUIMSLOT?", "SIM Slot Configuration", 1.0, 3),
+            ("6", "GPS Status (AT+QGPS?)", "AT+QGPS?", "GPS Status", 1.0, 3),
+            ("7", "Check eSIM Support (AT+QESIM)", "AT+QESIM=\"eid\"", "eSIM Support (EID)", 1.0, 3),
+            ("0", "Back to Main Menu", None, None, 0, 0),
+        ]
+        commands = {item[0]: item[2:] for item in menu_items}
+        choices = list(commands)
+
         while True:
             console.print("\n")
             console.rule("[bold cyan]Quectel Advanced Tools", style="cyan")
@@ -3777,56 +4712,22 @@ class ModemDiagnosticTool:
                 console.print(f"[dim]Model: {model}[/dim]")
             console.print()
 
-            console.print("  [bold cyan]1[/bold cyan]. View Advanced Cell Information (AT+QENG)")
-            console.print("  [bold cyan]2[/bold cyan]. View Network Info (AT+QNWINFO)")
-            console.print("  [bold cyan]3[/bold cyan]. Check Temperature (AT+QTEMP)")
-            console.print("  [bold cyan]4[/bold cyan]. View Neighboring Cells (AT+QENG=\"neighbourcell\")")
-            console.print("  [bold cyan]5[/bold cyan]. Query SIM Slot (AT+QUIMSLOT?)")
-            console.print("  [bold cyan]6[/bold cyan]. GPS Status (AT+QGPS?)")
-            console.print("  [bold cyan]7[/bold cyan]. Check eSIM Support (AT+QESIM)")
-            console.print("  [bold cyan]0[/bold cyan]. Back to Main Menu")
+            for num, label, *_ in menu_items:
+                console.print(f"  [bold cyan]{num}[/bold cyan]. {label}")
             console.print()
 
-            choice = Prompt.ask("Select option", choices=["0", "1", "2", "3", "4", "5", "6", "7"], default="1")
+            choice = Prompt.ask("Select option", choices=choices, default="1")
 
             if choice == "0":
                 break
-            elif choice == "1":
-                result = self.modem.send_at_command("AT+QENG=\"servingcell\"")
-                self._display_at_result("Advanced Cell Information", result)
-                console.print()
-                auto_continue(3, "Returning to menu")
-            elif choice == "2":
-                result = self.modem.send_at_command("AT+QNWINFO")
-                self._display_at_result("Network Information", result)
-                console.print()
-                auto_continue(3, "Returning to menu")
-            elif choice == "3":
-                result = self.modem.send_at_command("AT+QTEMP")
-                self._display_at_result("Temperature Reading", result)
-                console.print()
-                auto_continue(3, "Returning to menu")
-            elif choice == "4":
+
+            command, title, wait_time, pause = commands[choice]
+            if choice == "4":
                 console.print("\n[cyan]Scanning neighbor cells (may take 5-10 seconds)...[/cyan]")
-                result = self.modem.send_at_command("AT+QENG=\"neighbourcell\"", wait_time=10)
-                self._display_at_result("Neighboring Cells", result)
-                console.print()
-                auto_continue(5, "Returning to menu")
-            elif choice == "5":
-                result = self.modem.send_at_command("AT+QUIMSLOT?")
-                self._display_at_result("SIM Slot Configuration", result)
-                console.print()
-                auto_continue(3, "Returning to menu")
-            elif choice == "6":
-                result = self.modem.send_at_command("AT+QGPS?")
-                self._display_at_result("GPS Status", result)
-                console.print()
-                auto_continue(3, "Returning to menu")
-            elif choice == "7":
-                result = self.modem.send_at_command("AT+QESIM=\"eid\"")
-                self._display_at_result("eSIM Support (EID)", result)
-                console.print()
-                auto_continue(3, "Returning to menu")
+            result = self.modem.send_at_command(command, wait_time=wait_time)
+            self._display_at_result(title, result)
+            console.print()
+            auto_continue(pause, "Returning to menu")
 
     def sierra_tools_menu(self):
         """Sierra Wireless-specific tools"""
@@ -3902,27 +4803,38 @@ class ModemDiagnosticTool:
         filename = os.path.join(output_dir, f"modem_diagnostic_{timestamp}.txt")
 
         try:
-            with open(filename, 'w') as f:
-                f.write("=" * 70 + "\n")
-                f.write("CELLULAR MODEM DIAGNOSTIC REPORT\n")
-                f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write("Generated by: Modem Diagnostic Tool (modemo)\n")
-                f.write("=" * 70 + "\n\n")
+            rule = "=" * 70
+            with open(filename, 'w', buffering=1 << 16) as f:
+                f.write("\n".join((
+                    rule,
+                    "CELLULAR MODEM DIAGNOSTIC REPORT",
+                    f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                    "Generated by: Modem Diagnostic Tool (modemo)",
+                    rule,
+                    "\n",
+                )))
 
                 for result in results:
-                    f.write(f"\nCommand: {result.command}\n")
-                    f.write(f"Timestamp: {result.timestamp}\n")
-                    f.write(f"Success: {result.success}\n")
+                    f.write(f"\nCommand: {result.command}\nTimestamp: {result.timestamp_dt}\nSuccess: {result.success}\n")
                     if result.error:
                         f.write(f"Error: {result.error}\n")
-                    f.write(f"\nRaw Response:\n{result.raw_response}\n")
-                    f.write(f"\nParsed Data:\n{json.dumps(result.parsed_data, indent=2)}\n")
-                    f.write("-" * 70 + "\n")
+                    if result.chained_command:
+                        f.write(f"\nRaw Response (shared, sent chained as {result.chained_command}):\n")
+                    else:
+                        f.write("\nRaw Response:\n")
+                    f.write(f"{result.raw_response}\n\nParsed Data:\n")
+                    # Serialise straight into the file rather than via an intermediate string
+                    json.dump(result.parsed_data, f, indent=2)
+                    f.write("\n" + "-" * 70 + "\n")
 
-                f.write("\n" + "=" * 70 + "\n")
-                f.write("Find this tool helpful?\n")
-                f.write("Support development: https://buymeacoffee.com/mike.brandon\n")
-                f.write("=" * 70 + "\n")
+                f.write("\n".join((
+                    "",
+                    rule,
+                    "Find this tool helpful?",
+                    "Support development: https://buymeacoffee.com/mike.brandon",
+                    rule,
+                    "",
+                )))
 
             console.print(f"[green]✓ Report saved to: {filename}[/green]")
         except Exception as e:
@@ -3956,11 +4868,11 @@ class ModemDiagnosticTool:
 
         if IS_LINUX:
             steps = [
-                ("Removing cellular default routes", ["sudo", "ip", "route", "del", "default", "dev", "wwan0"]),
-                ("Removing cellular default routes (alt)", ["sudo", "ip", "route", "del", "default", "dev", "ppp0"]),
-                ("Removing cellular default routes (alt2)", ["sudo", "ip", "route", "del", "default", "dev", "usb0"]),
-                ("Bringing WiFi interface UP", ["sudo", "ip", "link", "set", "wlan0", "up"]),
-                ("Restarting DHCP on WiFi", ["sudo", "dhclient", "wlan0"]),
+                ("Removing cellular default routes", [_SUDO_BIN, _IP_BIN, "route", "del", "default", "dev", "wwan0"]),
+                ("Removing cellular default routes (alt)", [_SUDO_BIN, _IP_BIN, "route", "del", "default", "dev", "ppp0"]),
+                ("Removing cellular default routes (alt2)", [_SUDO_BIN, _IP_BIN, "route", "del", "default", "dev", "usb0"]),
+                ("Bringing WiFi interface UP", [_SUDO_BIN, _IP_BIN, "link", "set", "wlan0", "up"]),
+                ("Restarting DHCP on WiFi", [_SUDO_BIN, "dhclient", "wlan0"]),
             ]
 
             for description, cmd in steps: